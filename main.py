@@ -1,80 +1,124 @@
-"""
-Dorothy's Mind Games
-=====================
-A narrative-driven chess roguelike where moves decide everything.
-
-Entry point — initialises Pygame, creates the state machine,
-and runs the main game loop at 60 FPS.
-
-Controls:
-  Mouse Left    — Select / move pieces
-  Mouse Right   — Hold for Genius Vision (PV preview)
-  G             — Toggle Genius Vision (costs Focus)
-  T             — Toggle Threat Map overlay
-  R             — Temporal Rewind (costs Soul)
-  F             — Flip board
-  ESC           — Menu / Quit
-"""
-
-from __future__ import annotations
-
-import sys
-
-import pygame
-
-from src.core.constants import FPS, SCREEN_HEIGHT, SCREEN_WIDTH, TITLE
-from src.core.state_manager import StateManager
-from src.states.intro_state import IntroState
-
-
-class Game:
-    """Top-level application: owns the window, clock, and state machine."""
-
-    def __init__(self) -> None:
-        pygame.init()
-        pygame.display.set_caption(TITLE)
-        self._screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self._clock = pygame.time.Clock()
-        self._running = True
-
-        # State machine — start with the intro cinematic
-        self._state_manager = StateManager()
-        self._state_manager.push(IntroState(self._state_manager))
-        self._state_manager.process_pending()  # immediately push the intro
-
-    def run(self) -> None:
-        """Main loop."""
-        while self._running:
-            dt = self._clock.tick(FPS) / 1000.0  # seconds
-
-            # ── Events ──────────────────────────────────────────────
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self._running = False
-                    break
-                self._state_manager.handle_event(event)
-
-            # ── Update ──────────────────────────────────────────────
-            self._state_manager.update(dt)
-            self._state_manager.process_pending()
-
-            # Exit if stack is empty
-            if self._state_manager.is_empty:
-                self._running = False
-                break
-
-            # ── Draw ────────────────────────────────────────────────
-            self._state_manager.draw(self._screen)
-            pygame.display.flip()
-
-        pygame.quit()
-        sys.exit()
-
-
-def main() -> None:
-    game = Game()
-    game.run()
-
-
-if __name__ == "__main__":
-    main()
+"""
+Dorothy's Mind Games
+=====================
+A narrative-driven chess roguelike where moves decide everything.
+
+Entry point — initialises Pygame, creates the state machine,
+and runs the main game loop at 60 FPS.
+
+Controls:
+  Mouse Left    — Select / move pieces
+  Mouse Right   — Hold for Genius Vision (PV preview)
+  G             — Toggle Genius Vision (costs Focus)
+  T             — Toggle Threat Map overlay
+  R             — Temporal Rewind (costs Soul)
+  F             — Flip board
+  ESC           — Menu / Quit
+"""
+
+from __future__ import annotations
+
+import sys
+
+import pygame
+
+from src.core.constants import FPS, SCREEN_HEIGHT, SCREEN_WIDTH, TITLE
+from src.core.state_manager import StateManager
+from src.states.intro_state import IntroState
+
+# Event types the game actually handles.  Everything else is blocked at
+# the SDL layer so the queue never fills with events we'd just discard.
+_WANTED_EVENTS: tuple[int, ...] = (
+    pygame.QUIT,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEWHEEL,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+)
+
+# Fixed simulation timestep.  Events are pumped and states updated at
+# this cadence regardless of how fast frames actually render.
+UPDATE_DT: float = 1.0 / FPS
+# Cap on queued simulation time so a long stall (window drag, engine
+# hiccup) doesn't trigger a catch-up spiral of updates.
+_MAX_ACCUMULATED: float = 4 * UPDATE_DT
+
+
+class Game:
+    """Top-level application: owns the window, clock, and state machine."""
+
+    def __init__(self) -> None:
+        pygame.init()
+        # Block every event type, then re-allow only the ones we handle —
+        # unused types (ACTIVEEVENT, joystick, …) never enter the queue.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(_WANTED_EVENTS))
+        pygame.display.set_caption(TITLE)
+        self._screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._clock = pygame.time.Clock()
+        # On Windows the plain tick() sleeps at ~15 ms scheduler
+        # granularity, causing visible frame jitter; busy-waiting there
+        # trades a little CPU for tight pacing.  Elsewhere tick() is fine.
+        self._tick = (
+            self._clock.tick_busy_loop if sys.platform == "win32" else self._clock.tick
+        )
+        self._running = True
+
+        # State machine — start with the intro cinematic
+        self._state_manager = StateManager()
+        self._state_manager.push(IntroState(self._state_manager))
+        self._state_manager.process_pending()  # immediately push the intro
+
+    def run(self) -> None:
+        """Main loop: fixed-timestep updates, rendering once per frame."""
+        accumulator = 0.0
+        while self._running:
+            accumulator += self._tick(FPS) / 1000.0  # seconds
+            if accumulator > _MAX_ACCUMULATED:
+                accumulator = _MAX_ACCUMULATED
+
+            # ── Fixed-timestep update steps ─────────────────────────
+            while accumulator >= UPDATE_DT and self._running:
+                accumulator -= UPDATE_DT
+
+                # Pump explicitly so event delivery is tied to the
+                # update cadence, not to display.flip().
+                pygame.event.pump()
+                if pygame.event.peek(_WANTED_EVENTS):
+                    events = pygame.event.get(_WANTED_EVENTS)
+                    for event in events:
+                        if event.type == pygame.QUIT:
+                            self._running = False
+                            break
+                    else:
+                        # Hand the whole batch over in one call; the
+                        # manager coalesces MOUSEMOTION runs internally.
+                        self._state_manager.handle_events(events)
+
+                self._state_manager.update(UPDATE_DT)
+                self._state_manager.process_pending()
+
+                # Exit if stack is empty
+                if self._state_manager.is_empty:
+                    self._running = False
+
+            if not self._running:
+                break
+
+            # ── Draw ────────────────────────────────────────────────
+            self._state_manager.draw(self._screen)
+            pygame.display.flip()
+
+        pygame.quit()
+        sys.exit()
+
+
+def main() -> None:
+    game = Game()
+    game.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,141 +1,179 @@
-"""
-Dorothy's Mind Games - Resource Manager
-========================================
-Manages the three core resources: Sanity, Soul, and Focus.
-Also tracks Flow State streaks and Limbo trauma stacks.
-"""
-
-from __future__ import annotations
-
-from dataclasses import dataclass, field
-
-from src.core.constants import (
-    FOCUS_COST_GENIUS_VISION,
-    FOCUS_REGEN_PER_TURN,
-    FLOW_STATE_DURATION,
-    FLOW_STATE_STREAK,
-    MAX_FOCUS,
-    MAX_SANITY,
-    MAX_SOUL,
-    SANITY_COST_LIMBO,
-    SOUL_COST_REWIND,
-)
-
-
-@dataclass
-class PlayerResources:
-    """Mutable container for Dorothy's RPG-style resources."""
-
-    # ── Core values ─────────────────────────────────────────────────
-    sanity: int = MAX_SANITY
-    sanity_max: int = MAX_SANITY  # can decrease from Limbo trauma
-    soul: int = MAX_SOUL
-    soul_max: int = MAX_SOUL
-    focus: int = MAX_FOCUS
-    focus_max: int = MAX_FOCUS
-
-    # ── Flow State ──────────────────────────────────────────────────
-    best_move_streak: int = 0
-    flow_state_active: bool = False
-    flow_state_timer: float = 0.0
-
-    # ── Limbo statistics ────────────────────────────────────────────
-    limbo_entries: int = 0
-    trauma_stacks: int = 0
-
-    # ── Move accuracy history ───────────────────────────────────────
-    total_moves: int = 0
-    brilliant_moves: int = 0
-    best_moves: int = 0
-    good_moves: int = 0
-    inaccuracies: int = 0
-    mistakes: int = 0
-    blunders: int = 0
-
-    # ── Sanity ──────────────────────────────────────────────────────
-    def drain_sanity(self, amount: int) -> None:
-        self.sanity = max(0, self.sanity - amount)
-
-    def restore_sanity(self, amount: int) -> None:
-        self.sanity = min(self.sanity_max, self.sanity + amount)
-
-    def apply_limbo_trauma(self) -> None:
-        """Permanent max-sanity reduction from a Limbo visit."""
-        self.limbo_entries += 1
-        self.trauma_stacks += 1
-        self.sanity_max = max(20, self.sanity_max - SANITY_COST_LIMBO)
-        self.sanity = min(self.sanity, self.sanity_max)
-
-    @property
-    def sanity_ratio(self) -> float:
-        return self.sanity / self.sanity_max if self.sanity_max else 0.0
-
-    @property
-    def is_insane(self) -> bool:
-        return self.sanity <= 0
-
-    # ── Soul ────────────────────────────────────────────────────────
-    def drain_soul(self, amount: int) -> None:
-        self.soul = max(0, self.soul - amount)
-
-    def restore_soul(self, amount: int) -> None:
-        self.soul = min(self.soul_max, self.soul + amount)
-
-    def spend_soul_for_rewind(self) -> bool:
-        """Attempt to spend Soul for a Temporal Rewind.  Returns success."""
-        if self.soul >= SOUL_COST_REWIND:
-            self.soul -= SOUL_COST_REWIND
-            return True
-        return False
-
-    @property
-    def soul_ratio(self) -> float:
-        return self.soul / self.soul_max if self.soul_max else 0.0
-
-    @property
-    def is_dead(self) -> bool:
-        return self.soul <= 0
-
-    # ── Focus ───────────────────────────────────────────────────────
-    def spend_focus(self, amount: int = FOCUS_COST_GENIUS_VISION) -> bool:
-        if self.focus >= amount:
-            self.focus -= amount
-            return True
-        return False
-
-    def regen_focus(self, multiplier: float = 1.0) -> None:
-        regen = int(FOCUS_REGEN_PER_TURN * multiplier)
-        self.focus = min(self.focus_max, self.focus + regen)
-
-    @property
-    def focus_ratio(self) -> float:
-        return self.focus / self.focus_max if self.focus_max else 0.0
-
-    # ── Flow State ──────────────────────────────────────────────────
-    def register_best_move(self) -> None:
-        self.best_move_streak += 1
-        self.best_moves += 1
-        self.total_moves += 1
-        if self.best_move_streak >= FLOW_STATE_STREAK and not self.flow_state_active:
-            self.flow_state_active = True
-            self.flow_state_timer = FLOW_STATE_DURATION
-
-    def break_streak(self) -> None:
-        self.best_move_streak = 0
-        self.flow_state_active = False
-        self.flow_state_timer = 0.0
-
-    def update_flow_timer(self, dt: float) -> None:
-        if self.flow_state_active:
-            self.flow_state_timer -= dt
-            if self.flow_state_timer <= 0:
-                self.flow_state_active = False
-                self.flow_state_timer = 0.0
-
-    # ── Accuracy ────────────────────────────────────────────────────
-    @property
-    def accuracy_percent(self) -> float:
-        if self.total_moves == 0:
-            return 100.0
-        good = self.brilliant_moves + self.best_moves + self.good_moves
-        return (good / self.total_moves) * 100.0
+"""
+Dorothy's Mind Games - Resource Manager
+========================================
+Manages the three core resources: Sanity, Soul, and Focus.
+Also tracks Flow State streaks and Limbo trauma stacks.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from src.core.constants import (
+    FOCUS_COST_GENIUS_VISION,
+    FOCUS_REGEN_PER_TURN,
+    FLOW_STATE_DURATION,
+    FLOW_STATE_STREAK,
+    MAX_FOCUS,
+    MAX_SANITY,
+    MAX_SOUL,
+    SANITY_COST_LIMBO,
+    SOUL_COST_REWIND,
+)
+
+
+# Field order for flat array snapshots (see PlayerResources.snapshot).
+_SNAPSHOT_FIELDS: tuple[str, ...] = (
+    "sanity", "sanity_max", "soul", "soul_max", "focus", "focus_max",
+    "best_move_streak", "flow_state_active", "flow_state_timer",
+    "limbo_entries", "trauma_stacks",
+    "sanity_ratio", "soul_ratio", "focus_ratio",
+    "total_moves", "brilliant_moves", "best_moves", "good_moves",
+    "inaccuracies", "mistakes", "blunders",
+)
+
+
+@dataclass(slots=True)
+class PlayerResources:
+    """Mutable container for Dorothy's RPG-style resources."""
+
+    # ── Core values ─────────────────────────────────────────────────
+    sanity: int = MAX_SANITY
+    sanity_max: int = MAX_SANITY  # can decrease from Limbo trauma
+    soul: int = MAX_SOUL
+    soul_max: int = MAX_SOUL
+    focus: int = MAX_FOCUS
+    focus_max: int = MAX_FOCUS
+
+    # ── Flow State ──────────────────────────────────────────────────
+    best_move_streak: int = 0
+    flow_state_active: bool = False
+    flow_state_timer: float = 0.0
+
+    # ── Limbo statistics ────────────────────────────────────────────
+    limbo_entries: int = 0
+    trauma_stacks: int = 0
+
+    # ── Cached ratios ───────────────────────────────────────────────
+    # Recomputed on mutation so per-frame HUD reads are plain attribute
+    # loads instead of property calls doing a division each access.
+    sanity_ratio: float = 1.0
+    soul_ratio: float = 1.0
+    focus_ratio: float = 1.0
+
+    # ── Move accuracy history ───────────────────────────────────────
+    total_moves: int = 0
+    brilliant_moves: int = 0
+    best_moves: int = 0
+    good_moves: int = 0
+    inaccuracies: int = 0
+    mistakes: int = 0
+    blunders: int = 0
+
+    # ── Sanity ──────────────────────────────────────────────────────
+    def drain_sanity(self, amount: int) -> None:
+        self.sanity = max(0, self.sanity - amount)
+        self._recalc_ratios()
+
+    def restore_sanity(self, amount: int) -> None:
+        self.sanity = min(self.sanity_max, self.sanity + amount)
+        self._recalc_ratios()
+
+    def apply_limbo_trauma(self) -> None:
+        """Permanent max-sanity reduction from a Limbo visit."""
+        self.limbo_entries += 1
+        self.trauma_stacks += 1
+        self.sanity_max = max(20, self.sanity_max - SANITY_COST_LIMBO)
+        self.sanity = min(self.sanity, self.sanity_max)
+        self._recalc_ratios()
+
+    @property
+    def is_insane(self) -> bool:
+        return self.sanity <= 0
+
+    # ── Soul ────────────────────────────────────────────────────────
+    def drain_soul(self, amount: int) -> None:
+        self.soul = max(0, self.soul - amount)
+        self._recalc_ratios()
+
+    def restore_soul(self, amount: int) -> None:
+        self.soul = min(self.soul_max, self.soul + amount)
+        self._recalc_ratios()
+
+    def spend_soul_for_rewind(self) -> bool:
+        """Attempt to spend Soul for a Temporal Rewind.  Returns success."""
+        if self.soul >= SOUL_COST_REWIND:
+            self.soul -= SOUL_COST_REWIND
+            self._recalc_ratios()
+            return True
+        return False
+
+    @property
+    def is_dead(self) -> bool:
+        return self.soul <= 0
+
+    # ── Focus ───────────────────────────────────────────────────────
+    def spend_focus(self, amount: int = FOCUS_COST_GENIUS_VISION) -> bool:
+        if self.focus >= amount:
+            self.focus -= amount
+            self._recalc_ratios()
+            return True
+        return False
+
+    def regen_focus(self, multiplier: float = 1.0) -> None:
+        regen = int(FOCUS_REGEN_PER_TURN * multiplier)
+        self.focus = min(self.focus_max, self.focus + regen)
+        self._recalc_ratios()
+
+    def _recalc_ratios(self) -> None:
+        self.sanity_ratio = self.sanity / self.sanity_max if self.sanity_max else 0.0
+        self.soul_ratio = self.soul / self.soul_max if self.soul_max else 0.0
+        self.focus_ratio = self.focus / self.focus_max if self.focus_max else 0.0
+
+    # ── Flow State ──────────────────────────────────────────────────
+    def register_best_move(self) -> None:
+        self.best_move_streak += 1
+        self.best_moves += 1
+        self.total_moves += 1
+        if self.best_move_streak >= FLOW_STATE_STREAK and not self.flow_state_active:
+            self.flow_state_active = True
+            self.flow_state_timer = FLOW_STATE_DURATION
+
+    def break_streak(self) -> None:
+        self.best_move_streak = 0
+        self.flow_state_active = False
+        self.flow_state_timer = 0.0
+
+    def update_flow_timer(self, dt: float) -> None:
+        if self.flow_state_active:
+            self.flow_state_timer -= dt
+            if self.flow_state_timer <= 0:
+                self.flow_state_active = False
+                self.flow_state_timer = 0.0
+
+    # ── Snapshots (Temporal Rewind) ─────────────────────────────────
+    def snapshot(self) -> np.ndarray:
+        """Capture all numeric state as one flat float64 array.
+
+        Restoring via :meth:`restore` is a single array walk, so a
+        per-turn snapshot costs one small allocation instead of
+        pickling the dataclass field by field.
+        """
+        return np.array(
+            [getattr(self, name) for name in _SNAPSHOT_FIELDS], dtype=np.float64
+        )
+
+    def restore(self, snap: np.ndarray) -> None:
+        """Restore state captured by :meth:`snapshot`."""
+        for name, value in zip(_SNAPSHOT_FIELDS, snap.tolist()):
+            setattr(self, name, type(getattr(self, name))(value))
+
+    # ── Accuracy ────────────────────────────────────────────────────
+    @property
+    def accuracy_percent(self) -> float:
+        if self.total_moves == 0:
+            return 100.0
+        good = self.brilliant_moves + self.best_moves + self.good_moves
+        return (good / self.total_moves) * 100.0
@@ -1,102 +1,148 @@
-"""
-Dorothy's Mind Games - State Manager
-=====================================
-A stack-based state machine that governs the flow between
-MainMenu → GameState → LimboState → GameOverState.
-
-States are pushed/popped like a call-stack so that Limbo can
-overlay the game and return to it when the puzzle is solved.
-"""
-
-from __future__ import annotations
-
-from typing import Protocol
-
-import pygame
-
-
-# ── State Protocol ──────────────────────────────────────────────────
-class GameStateProtocol(Protocol):
-    """Every state must implement these four methods."""
-
-    def enter(self) -> None: ...
-    def exit(self) -> None: ...
-    def handle_event(self, event: pygame.event.Event) -> None: ...
-    def update(self, dt: float) -> None: ...
-    def draw(self, surface: pygame.Surface) -> None: ...
-
-
-# ── State Manager ───────────────────────────────────────────────────
-class StateManager:
-    """Stack-based finite state machine.
-
-    * ``push(state)`` – push *state* on top (calls ``state.enter``).
-    * ``pop()``       – remove the top state (calls ``state.exit``).
-    * ``switch(state)`` – pop current, then push *state*.
-    """
-
-    def __init__(self) -> None:
-        self._stack: list[GameStateProtocol] = []
-        self._pending_push: GameStateProtocol | None = None
-        self._pending_pop: bool = False
-        self._pending_switch: GameStateProtocol | None = None
-
-    # ── public API ──────────────────────────────────────────────────
-    @property
-    def current(self) -> GameStateProtocol | None:
-        return self._stack[-1] if self._stack else None
-
-    @property
-    def is_empty(self) -> bool:
-        return len(self._stack) == 0
-
-    def push(self, state: GameStateProtocol) -> None:
-        """Schedule *state* to be pushed at the end of the frame."""
-        self._pending_push = state
-
-    def pop(self) -> None:
-        """Schedule the top state to be popped at the end of the frame."""
-        self._pending_pop = True
-
-    def switch(self, state: GameStateProtocol) -> None:
-        """Schedule a pop-then-push (swap) at the end of the frame."""
-        self._pending_switch = state
-
-    # ── frame lifecycle ─────────────────────────────────────────────
-    def process_pending(self) -> None:
-        """Apply deferred push/pop/switch.  Call once per frame AFTER update."""
-        if self._pending_switch is not None:
-            if self._stack:
-                self._stack[-1].exit()
-                self._stack.pop()
-            self._pending_switch.enter()
-            self._stack.append(self._pending_switch)
-            self._pending_switch = None
-            return
-
-        if self._pending_pop:
-            if self._stack:
-                self._stack[-1].exit()
-                self._stack.pop()
-                if self._stack:
-                    self._stack[-1].enter()
-            self._pending_pop = False
-
-        if self._pending_push is not None:
-            self._pending_push.enter()
-            self._stack.append(self._pending_push)
-            self._pending_push = None
-
-    def handle_event(self, event: pygame.event.Event) -> None:
-        if self.current:
-            self.current.handle_event(event)
-
-    def update(self, dt: float) -> None:
-        if self.current:
-            self.current.update(dt)
-
-    def draw(self, surface: pygame.Surface) -> None:
-        # Draw all states bottom-up so overlays (e.g. Limbo) can
-        # render on top of the frozen game board.
-        for state in self._stack:
-            state.draw(surface)
+"""
+Dorothy's Mind Games - State Manager
+=====================================
+A stack-based state machine that governs the flow between
+MainMenu → GameState → LimboState → GameOverState.
+
+States are pushed/popped like a call-stack so that Limbo can
+overlay the game and return to it when the puzzle is solved.
+"""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+import pygame
+
+
+# ── State Protocol ──────────────────────────────────────────────────
+class GameStateProtocol(Protocol):
+    """Every state must implement these four methods."""
+
+    # States that fill the whole window each frame set this True so the
+    # manager can skip drawing everything buried underneath them.
+    is_opaque: bool
+
+    def enter(self) -> None: ...
+    def exit(self) -> None: ...
+    def handle_event(self, event: pygame.event.Event) -> None: ...
+    def update(self, dt: float) -> None: ...
+    def draw(self, surface: pygame.Surface) -> None: ...
+
+
+# ── State Manager ───────────────────────────────────────────────────
+class StateManager:
+    """Stack-based finite state machine.
+
+    * ``push(state)`` – push *state* on top (calls ``state.enter``).
+    * ``pop()``       – remove the top state (calls ``state.exit``).
+    * ``switch(state)`` – pop current, then push *state*.
+    """
+
+    def __init__(self) -> None:
+        self._stack: list[GameStateProtocol] = []
+        self._pending_push: GameStateProtocol | None = None
+        self._pending_pop: bool = False
+        self._pending_switch: GameStateProtocol | None = None
+        self._has_pending: bool = False
+
+    # ── public API ──────────────────────────────────────────────────
+    @property
+    def current(self) -> GameStateProtocol | None:
+        return self._stack[-1] if self._stack else None
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self._stack) == 0
+
+    def push(self, state: GameStateProtocol) -> None:
+        """Schedule *state* to be pushed at the end of the frame."""
+        self._pending_push = state
+        self._has_pending = True
+
+    def pop(self) -> None:
+        """Schedule the top state to be popped at the end of the frame."""
+        self._pending_pop = True
+        self._has_pending = True
+
+    def switch(self, state: GameStateProtocol) -> None:
+        """Schedule a pop-then-push (swap) at the end of the frame."""
+        self._pending_switch = state
+        self._has_pending = True
+
+    # ── frame lifecycle ─────────────────────────────────────────────
+    def process_pending(self) -> None:
+        """Apply deferred push/pop/switch.  Call once per frame AFTER update."""
+        # Fast path: nothing scheduled, which is the case on almost
+        # every frame — one bool check instead of three.
+        if not self._has_pending:
+            return
+        self._has_pending = False
+
+        if self._pending_switch is not None:
+            if self._stack:
+                self._stack[-1].exit()
+                self._stack.pop()
+            self._pending_switch.enter()
+            self._stack.append(self._pending_switch)
+            self._pending_switch = None
+            # A pop/push scheduled alongside the switch is handled next
+            # frame, as before — keep the flag alive for it.
+            self._has_pending = self._pending_pop or self._pending_push is not None
+            return
+
+        if self._pending_pop:
+            if self._stack:
+                self._stack[-1].exit()
+                self._stack.pop()
+                if self._stack:
+                    self._stack[-1].enter()
+            self._pending_pop = False
+
+        if self._pending_push is not None:
+            self._pending_push.enter()
+            self._stack.append(self._pending_push)
+            self._pending_push = None
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if self.current:
+            self.current.handle_event(event)
+
+    def handle_events(self, events: list[pygame.event.Event]) -> None:
+        """Dispatch one frame's worth of events as a batch.
+
+        Resolves the active state once and coalesces runs of MOUSEMOTION
+        (only the last position of a run matters), so a high-polling-rate
+        mouse doesn't multiply per-event dispatch cost.
+        """
+        current = self.current
+        if current is None:
+            return
+        motion = pygame.MOUSEMOTION
+        pending_motion: pygame.event.Event | None = None
+        for event in events:
+            if event.type == motion:
+                pending_motion = event
+                continue
+            if pending_motion is not None:
+                current.handle_event(pending_motion)
+                pending_motion = None
+            current.handle_event(event)
+        if pending_motion is not None:
+            current.handle_event(pending_motion)
+
+    def update(self, dt: float) -> None:
+        if self.current:
+            self.current.update(dt)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        # Draw bottom-up so overlays (e.g. Limbo) can render on top of
+        # the frozen game board — but start at the highest opaque state,
+        # since anything below it would be fully painted over anyway.
+        start = 0
+        for i in range(len(self._stack) - 1, -1, -1):
+            if getattr(self._stack[i], "is_opaque", True):
+                start = i
+                break
+        for state in self._stack[start:]:
+            state.draw(surface)
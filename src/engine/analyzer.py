@@ -1,299 +1,473 @@
-"""
-Dorothy's Mind Games - Stockfish Analyzer
-==========================================
-Asynchronous chess engine integration via UCI protocol.
-
-Runs Stockfish in a background thread, continuously analysing
-the current board position. Results are pushed into a thread-safe
-queue that the main loop can poll without blocking rendering.
-"""
-
-from __future__ import annotations
-
-import subprocess
-import threading
-import time
-from dataclasses import dataclass, field
-from queue import Empty, Queue
-from typing import Optional
-
-import chess
-
-from src.core.constants import (
-    BLUNDER_THRESHOLD_CP,
-    INACCURACY_THRESHOLD_CP,
-    MISTAKE_THRESHOLD_CP,
-    STOCKFISH_ANALYSIS_DEPTH,
-    STOCKFISH_DEFAULT_DEPTH,
-    STOCKFISH_PATH,
-)
-
-
-# ── Data Structures ─────────────────────────────────────────────────
-@dataclass
-class AnalysisResult:
-    """Snapshot of engine evaluation at a given depth."""
-    depth: int = 0
-    score_cp: int = 0            # centipawns from White's perspective
-    score_mate: int | None = None  # mate-in-N (positive = White wins)
-    best_move: str = ""          # UCI string e.g. "e2e4"
-    pv: list[str] = field(default_factory=list)  # principal variation
-    nodes: int = 0
-    nps: int = 0
-    is_mate: bool = False
-
-    @property
-    def display_eval(self) -> str:
-        if self.is_mate and self.score_mate is not None:
-            return f"M{self.score_mate}"
-        return f"{self.score_cp / 100:+.2f}"
-
-
-@dataclass
-class MoveClassification:
-    """How good was the player's move compared to the engine's best?"""
-    uci_move: str
-    eval_before: int  # cp before the move
-    eval_after: int   # cp after the move
-    cp_loss: int      # absolute centipawn loss
-    label: str        # "brilliant", "best", "good", "inaccuracy", "mistake", "blunder"
-    is_blunder: bool = False
-
-    @staticmethod
-    def classify(cp_loss: int) -> str:
-        if cp_loss <= 0:
-            return "brilliant"
-        elif cp_loss <= 10:
-            return "best"
-        elif cp_loss < INACCURACY_THRESHOLD_CP:
-            return "good"
-        elif cp_loss < MISTAKE_THRESHOLD_CP:
-            return "inaccuracy"
-        elif cp_loss < BLUNDER_THRESHOLD_CP:
-            return "mistake"
-        else:
-            return "blunder"
-
-
-# ── Stockfish Analyzer ──────────────────────────────────────────────
-class StockfishAnalyzer:
-    """Manages a Stockfish subprocess and provides non-blocking analysis.
-
-    Usage::
-
-        analyzer = StockfishAnalyzer()
-        analyzer.start()
-        analyzer.set_position(board.fen())
-        ...
-        result = analyzer.get_latest()
-        ...
-        analyzer.stop()
-    """
-
-    def __init__(self, path: str = STOCKFISH_PATH, depth: int = STOCKFISH_DEFAULT_DEPTH) -> None:
-        self._path = path
-        self._depth = depth
-        self._process: subprocess.Popen | None = None
-        self._thread: threading.Thread | None = None
-        self._queue: Queue[AnalysisResult] = Queue(maxsize=64)
-        self._running = threading.Event()
-        self._new_position = threading.Event()
-        self._lock = threading.Lock()
-        self._current_fen: str = chess.STARTING_FEN
-        self._latest: AnalysisResult = AnalysisResult()
-        self._available: bool = False
-
-    # ── Lifecycle ───────────────────────────────────────────────────
-    def start(self) -> bool:
-        """Launch the Stockfish process and reader thread.
-        Returns True if engine started successfully."""
-        try:
-            self._process = subprocess.Popen(
-                [self._path],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                bufsize=1,
-            )
-            self._send("uci")
-            # Wait for "uciok"
-            deadline = time.time() + 5.0
-            while time.time() < deadline:
-                line = self._process.stdout.readline().strip()  # type: ignore[union-attr]
-                if line == "uciok":
-                    break
-            else:
-                self._kill()
-                return False
-
-            self._send("isready")
-            deadline = time.time() + 5.0
-            while time.time() < deadline:
-                line = self._process.stdout.readline().strip()  # type: ignore[union-attr]
-                if line == "readyok":
-                    break
-
-            self._available = True
-            self._running.set()
-            self._thread = threading.Thread(target=self._analysis_loop, daemon=True)
-            self._thread.start()
-            return True
-
-        except FileNotFoundError:
-            print(f"[Analyzer] Stockfish not found at '{self._path}'. "
-                  "AI analysis will be disabled.")
-            self._available = False
-            return False
-        except Exception as exc:
-            print(f"[Analyzer] Failed to start Stockfish: {exc}")
-            self._available = False
-            return False
-
-    def stop(self) -> None:
-        """Gracefully shut down the engine."""
-        self._running.clear()
-        self._new_position.set()  # unblock the thread if waiting
-        if self._process:
-            self._send("quit")
-            try:
-                self._process.wait(timeout=3)
-            except subprocess.TimeoutExpired:
-                self._kill()
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=2)
-
-    @property
-    def is_available(self) -> bool:
-        return self._available
-
-    # ── Position Control ────────────────────────────────────────────
-    def set_position(self, fen: str) -> None:
-        """Update the position the engine should analyse."""
-        with self._lock:
-            self._current_fen = fen
-        self._new_position.set()
-
-    # ── Results ─────────────────────────────────────────────────────
-    def get_latest(self) -> AnalysisResult:
-        """Return the most recent analysis result (non-blocking)."""
-        # Drain the queue and keep only the freshest result.
-        latest = self._latest
-        try:
-            while True:
-                latest = self._queue.get_nowait()
-        except Empty:
-            pass
-        self._latest = latest
-        return latest
-
-    def classify_move(
-        self, eval_before_cp: int, eval_after_cp: int, uci_move: str, player_is_white: bool
-    ) -> MoveClassification:
-        """Classify a player move by comparing evaluations."""
-        # Normalise to the player's perspective
-        if player_is_white:
-            loss = eval_before_cp - eval_after_cp
-        else:
-            loss = eval_after_cp - eval_before_cp  # from Black's view, lower is better
-        loss = max(0, loss)
-        label = MoveClassification.classify(loss)
-        return MoveClassification(
-            uci_move=uci_move,
-            eval_before=eval_before_cp,
-            eval_after=eval_after_cp,
-            cp_loss=loss,
-            label=label,
-            is_blunder=(loss >= BLUNDER_THRESHOLD_CP),
-        )
-
-    # ── Internal ────────────────────────────────────────────────────
-    def _send(self, command: str) -> None:
-        if self._process and self._process.stdin:
-            self._process.stdin.write(command + "\n")
-            self._process.stdin.flush()
-
-    def _kill(self) -> None:
-        if self._process:
-            try:
-                self._process.kill()
-            except OSError:
-                pass
-            self._process = None
-
-    def _analysis_loop(self) -> None:
-        """Background thread: continuously analyse positions."""
-        while self._running.is_set():
-            self._new_position.wait(timeout=0.5)
-            self._new_position.clear()
-
-            if not self._running.is_set():
-                break
-
-            with self._lock:
-                fen = self._current_fen
-
-            # Stop any in-progress search and start a new one
-            self._send("stop")
-            self._send(f"position fen {fen}")
-            self._send(f"go depth {self._depth}")
-
-            # Read engine output until "bestmove"
-            result = AnalysisResult()
-            while self._running.is_set():
-                if not self._process or not self._process.stdout:
-                    break
-                line = self._process.stdout.readline().strip()
-                if not line:
-                    continue
-
-                if line.startswith("info depth"):
-                    result = self._parse_info(line)
-                    # Push intermediate results so UI stays responsive
-                    if not self._queue.full():
-                        self._queue.put(result)
-
-                elif line.startswith("bestmove"):
-                    tokens = line.split()
-                    if len(tokens) >= 2:
-                        result.best_move = tokens[1]
-                    if not self._queue.full():
-                        self._queue.put(result)
-                    break
-
-    @staticmethod
-    def _parse_info(line: str) -> AnalysisResult:
-        """Parse a UCI ``info`` line into an AnalysisResult."""
-        tokens = line.split()
-        result = AnalysisResult()
-        i = 0
-        while i < len(tokens):
-            tok = tokens[i]
-            if tok == "depth" and i + 1 < len(tokens):
-                result.depth = int(tokens[i + 1])
-                i += 2
-            elif tok == "score" and i + 2 < len(tokens):
-                kind = tokens[i + 1]
-                val = int(tokens[i + 2])
-                if kind == "cp":
-                    result.score_cp = val
-                    result.is_mate = False
-                elif kind == "mate":
-                    result.score_mate = val
-                    result.is_mate = True
-                    result.score_cp = 30000 if val > 0 else -30000
-                i += 3
-            elif tok == "nodes" and i + 1 < len(tokens):
-                result.nodes = int(tokens[i + 1])
-                i += 2
-            elif tok == "nps" and i + 1 < len(tokens):
-                result.nps = int(tokens[i + 1])
-                i += 2
-            elif tok == "pv":
-                result.pv = tokens[i + 1:]
-                if result.pv:
-                    result.best_move = result.pv[0]
-                break
-            else:
-                i += 1
-        return result
+"""
+Dorothy's Mind Games - Stockfish Analyzer
+==========================================
+Asynchronous chess engine integration via UCI protocol.
+
+Runs Stockfish in a background thread, continuously analysing
+the current board position. Results are pushed into a thread-safe
+queue that the main loop can poll without blocking rendering.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import os
+import selectors
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+import chess
+import numpy as np
+
+from src.core.constants import (
+    BLUNDER_THRESHOLD_CP,
+    INACCURACY_THRESHOLD_CP,
+    MISTAKE_THRESHOLD_CP,
+    STOCKFISH_ANALYSIS_DEPTH,
+    STOCKFISH_DEFAULT_DEPTH,
+    STOCKFISH_PATH,
+)
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+# Classification buckets: cp_loss <= 0 → brilliant, <= 10 → best, then
+# the constants.py thresholds.  bisect keeps the lookup in C instead of
+# walking an if/elif ladder after every engine update.
+_CLASSIFY_THRESHOLDS: tuple[int, ...] = (
+    0,
+    10,
+    INACCURACY_THRESHOLD_CP - 1,
+    MISTAKE_THRESHOLD_CP - 1,
+    BLUNDER_THRESHOLD_CP - 1,
+)
+_CLASSIFY_LABELS: tuple[str, ...] = (
+    "brilliant", "best", "good", "inaccuracy", "mistake", "blunder",
+)
+_CLASSIFY_THRESHOLDS_ARR = np.asarray(_CLASSIFY_THRESHOLDS, dtype=np.int64)
+
+
+# ── Data Structures ─────────────────────────────────────────────────
+@dataclass(slots=True)
+class AnalysisResult:
+    """Snapshot of engine evaluation at a given depth."""
+    # Which set_position() call this result answers.  The reader
+    # thread echoes the generation active when the search started, so
+    # consumers can tell a fresh evaluation from the tail end of a
+    # search of the previous position.  -1 = not produced by a search.
+    generation: int = -1
+    depth: int = 0
+    score_cp: int = 0            # centipawns from White's perspective
+    score_mate: int | None = None  # mate-in-N (positive = White wins)
+    best_move: str = ""          # UCI string e.g. "e2e4"
+    pv: list[str] = field(default_factory=list)  # principal variation
+    nodes: int = 0
+    nps: int = 0
+    is_mate: bool = False
+
+    @property
+    def display_eval(self) -> str:
+        if self.is_mate and self.score_mate is not None:
+            return f"M{self.score_mate}"
+        return f"{self.score_cp / 100:+.2f}"
+
+
+@dataclass(slots=True)
+class MoveClassification:
+    """How good was the player's move compared to the engine's best?"""
+    uci_move: str
+    eval_before: int  # cp before the move
+    eval_after: int   # cp after the move
+    cp_loss: int      # absolute centipawn loss
+    label: str        # "brilliant", "best", "good", "inaccuracy", "mistake", "blunder"
+    is_blunder: bool = False
+
+    @staticmethod
+    def classify(cp_loss: int) -> str:
+        return _CLASSIFY_LABELS[bisect.bisect_left(_CLASSIFY_THRESHOLDS, cp_loss)]
+
+
+# ── Stockfish Analyzer ──────────────────────────────────────────────
+class StockfishAnalyzer:
+    """Manages a Stockfish subprocess and provides non-blocking analysis.
+
+    Usage::
+
+        analyzer = StockfishAnalyzer()
+        analyzer.start()
+        analyzer.set_position(board.fen())
+        ...
+        result = analyzer.get_latest()
+        ...
+        analyzer.stop()
+    """
+
+    def __init__(self, path: str = STOCKFISH_PATH, depth: int = STOCKFISH_DEFAULT_DEPTH) -> None:
+        self._path = path
+        self._depth = depth
+        self._process: subprocess.Popen | None = None
+        self._thread: threading.Thread | None = None
+        # Single-slot "mailbox" for the freshest result.  append() on a
+        # bounded deque atomically evicts the stale entry under the GIL,
+        # so no lock is needed and the reader thread never contends with
+        # the UI thread.
+        self._latest_slot: deque[AnalysisResult] = deque([AnalysisResult()], maxlen=1)
+        self._running = threading.Event()
+        self._new_position = threading.Event()
+        self._lock = threading.Lock()
+        self._current_fen: str = chess.STARTING_FEN
+        # Bumped by every set_position(); results carry the generation
+        # of the position they were computed for.
+        self._generation: int = 0
+        self._available: bool = False
+        # Self-pipe: stop() writes a byte here to break the reader
+        # thread out of its select() immediately.
+        self._wake_r, self._wake_w = os.pipe()
+
+    # ── Lifecycle ───────────────────────────────────────────────────
+    def start(self) -> bool:
+        """Launch the Stockfish process and reader thread.
+        Returns True if engine started successfully."""
+        try:
+            # On Windows, suppress the console the child would otherwise
+            # allocate — it costs ~50 ms at launch and leaks a window
+            # handle per engine instance.
+            popen_kwargs: dict = {}
+            if sys.platform == "win32":
+                si = subprocess.STARTUPINFO()
+                si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+                popen_kwargs["startupinfo"] = si
+                popen_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+
+            # Binary pipes: UCI is pure ASCII, so the text layer's UTF-8
+            # incremental decoder would be pure overhead on every line.
+            self._process = subprocess.Popen(
+                [self._path],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                **popen_kwargs,
+            )
+            self._send("uci")
+            # Wait for "uciok"
+            deadline = time.time() + 5.0
+            while time.time() < deadline:
+                line = self._process.stdout.readline().strip()  # type: ignore[union-attr]
+                if line == b"uciok":
+                    break
+            else:
+                self._kill()
+                return False
+
+            self._send("isready")
+            deadline = time.time() + 5.0
+            while time.time() < deadline:
+                line = self._process.stdout.readline().strip()  # type: ignore[union-attr]
+                if line == b"readyok":
+                    break
+
+            self._available = True
+            self._running.set()
+            self._thread = threading.Thread(target=self._analysis_loop, daemon=True)
+            self._thread.start()
+            return True
+
+        except FileNotFoundError:
+            log.warning("Stockfish not found at '%s'. AI analysis will be disabled.",
+                        self._path)
+            self._available = False
+            return False
+        except Exception:
+            log.warning("Failed to start Stockfish", exc_info=True)
+            self._available = False
+            return False
+
+    def stop(self) -> None:
+        """Gracefully shut down the engine."""
+        self._running.clear()
+        self._new_position.set()  # unblock the thread if waiting
+        try:
+            os.write(self._wake_w, b"\0")  # break the reader's select()
+        except OSError:
+            pass
+        if self._process:
+            with self._lock:
+                self._send("quit")
+            try:
+                self._process.wait(timeout=3)
+            except subprocess.TimeoutExpired:
+                self._kill()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=2)
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    @property
+    def is_available(self) -> bool:
+        return self._available
+
+    # ── Position Control ────────────────────────────────────────────
+    def set_position(self, fen: str) -> int:
+        """Update the position the engine should analyse.
+
+        Returns the generation number assigned to this position.  Every
+        result published for it carries the same number, which is the
+        only reliable way to distinguish a fresh evaluation from the
+        mailbox still holding output of the previous search.
+        """
+        with self._lock:
+            self._current_fen = fen
+            self._generation += 1
+            gen = self._generation
+            # Interrupt the in-flight search immediately rather than
+            # letting it run to bestmove while publishing stale evals.
+            if self._available:
+                self._send("stop")
+        self._new_position.set()
+        return gen
+
+    # ── Results ─────────────────────────────────────────────────────
+    def get_latest(self) -> AnalysisResult:
+        """Return the most recent analysis result (non-blocking)."""
+        return self._latest_slot[-1]
+
+    def classify_move(
+        self, eval_before_cp: int, eval_after_cp: int, uci_move: str, player_is_white: bool
+    ) -> MoveClassification:
+        """Classify a player move by comparing evaluations."""
+        # Normalise to the player's perspective
+        if player_is_white:
+            loss = eval_before_cp - eval_after_cp
+        else:
+            loss = eval_after_cp - eval_before_cp  # from Black's view, lower is better
+        loss = max(0, loss)
+        label = MoveClassification.classify(loss)
+        return MoveClassification(
+            uci_move=uci_move,
+            eval_before=eval_before_cp,
+            eval_after=eval_after_cp,
+            cp_loss=loss,
+            label=label,
+            is_blunder=(loss >= BLUNDER_THRESHOLD_CP),
+        )
+
+    @staticmethod
+    def classify_move_history(
+        eval_cp: "np.ndarray", white_mask: "np.ndarray"
+    ) -> "np.ndarray":
+        """Classify every move of a finished game in one vectorised pass.
+
+        ``eval_cp[i]`` is the evaluation before move *i* (always from
+        White's perspective, one extra trailing entry for the final
+        position); ``white_mask[i]`` is True where move *i* was played
+        by White.  Returns indices into the classification labels
+        (0 = brilliant … 5 = blunder), one per move — suited to
+        post-mortem review where N single calls would be pure Python
+        loop overhead.
+        """
+        eval_cp = np.asarray(eval_cp, dtype=np.int64)
+        white_mask = np.asarray(white_mask, dtype=bool)
+        loss = np.where(
+            white_mask, eval_cp[:-1] - eval_cp[1:], eval_cp[1:] - eval_cp[:-1]
+        )
+        np.maximum(loss, 0, out=loss)
+        return np.searchsorted(_CLASSIFY_THRESHOLDS_ARR, loss, side="left")
+
+    # ── Internal ────────────────────────────────────────────────────
+    def _send(self, command: str) -> None:
+        if self._process and self._process.stdin:
+            self._process.stdin.write((command + "\n").encode("ascii"))
+            self._process.stdin.flush()
+
+    def _kill(self) -> None:
+        if self._process:
+            try:
+                self._process.kill()
+            except OSError:
+                pass
+            self._process = None
+
+    @staticmethod
+    def _set_reader_affinity() -> None:
+        """Best-effort: keep the reader thread off the render core.
+
+        Pipe reads delayed by a busy render thread let Stockfish's
+        output buffer fill and stall the search; steering the reader to
+        the remaining cores improves overlap.  Silently a no-op where
+        the platform doesn't support per-thread affinity.
+        """
+        try:
+            if sys.platform == "win32":
+                import ctypes
+
+                kernel32 = ctypes.windll.kernel32
+                kernel32.SetThreadAffinityMask(kernel32.GetCurrentThread(), 0x2)
+            else:
+                cpus = os.sched_getaffinity(0)
+                if len(cpus) > 1:
+                    cpus.discard(min(cpus))
+                    os.sched_setaffinity(0, cpus)
+        except (AttributeError, OSError):
+            pass
+
+    def _analysis_loop(self) -> None:
+        """Background thread: continuously analyse positions."""
+        self._set_reader_affinity()
+        while self._running.is_set():
+            # Block until a position actually arrives — a timeout here
+            # would fall through twice a second and needlessly restart
+            # Stockfish's search with stop/position/go.  stop() sets the
+            # event, so shutdown still wakes us.
+            self._new_position.wait()
+            self._new_position.clear()
+
+            if not self._running.is_set():
+                break
+
+            # Start the new search under the lock so the stdin writes
+            # never interleave with a concurrent set_position("stop").
+            with self._lock:
+                fen = self._current_fen
+                gen = self._generation
+                self._send("stop")
+                self._send(f"position fen {fen}")
+                self._send(f"go depth {self._depth}")
+
+            # Read engine output until "bestmove"
+            result = AnalysisResult(generation=gen)
+            last_push = 0.0  # monotonic time of the last published result
+            for raw in self._iter_lines():
+                # Decode only the lines we actually parse — the bulk of
+                # engine chatter is discarded as raw bytes.
+                if raw.startswith(b"info depth"):
+                    # A newer position is already queued — drain the
+                    # dying search without publishing its evaluations.
+                    if self._new_position.is_set():
+                        continue
+                    # Shallow iterations arrive far faster than the UI
+                    # consumes them; rate-limit intermediate parses but
+                    # never skip lines at (or near) the target depth.
+                    # Depth is always the first field, so peek at the
+                    # raw bytes before committing to a full parse.
+                    now = time.monotonic()
+                    if now - last_push < 0.05:
+                        end = raw.find(b" ", 11)
+                        depth_bytes = raw[11:end] if end > 0 else raw[11:]
+                        if not depth_bytes.isdigit() or int(depth_bytes) < self._depth - 1:
+                            continue
+                    result = self._parse_info(raw.decode("ascii", "ignore"))
+                    result.generation = gen
+                    # Publish intermediate results so UI stays responsive
+                    self._latest_slot.append(result)
+                    last_push = now
+
+                elif raw.startswith(b"bestmove"):
+                    if not self._new_position.is_set():
+                        tokens = raw.decode("ascii", "ignore").split()
+                        if len(tokens) >= 2:
+                            result.best_move = tokens[1]
+                        self._latest_slot.append(result)
+                    break
+
+    def _iter_lines(self):
+        """Yield complete, stripped output lines from the engine.
+
+        Uses ``select`` on the raw pipe plus the wake self-pipe so the
+        reader thread never sits in a blocking ``readline`` — ``stop()``
+        interrupts it immediately.  Windows pipes can't be select()ed,
+        so there the blocking read is kept as a fallback.
+        """
+        if not self._process or not self._process.stdout:
+            return
+        stdout = self._process.stdout
+        fd = stdout.fileno()
+
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(fd, selectors.EVENT_READ)
+            sel.register(self._wake_r, selectors.EVENT_READ)
+        except (OSError, ValueError):
+            sel.close()
+            while self._running.is_set():
+                raw = stdout.readline()
+                if not raw:
+                    return
+                line = raw.strip()
+                if line:
+                    yield line
+            return
+
+        buf = bytearray()
+        try:
+            while self._running.is_set():
+                for key, _ in sel.select(timeout=0.1):
+                    if key.fd == self._wake_r:
+                        os.read(self._wake_r, 4096)  # drain the wake byte
+                        return
+                    chunk = os.read(fd, 4096)
+                    if not chunk:
+                        return  # engine exited
+                    buf += chunk
+                    while True:
+                        nl = buf.find(b"\n")
+                        if nl < 0:
+                            break
+                        line = bytes(buf[:nl]).strip()
+                        del buf[:nl + 1]
+                        if line:
+                            yield line
+        finally:
+            sel.close()
+
+    @staticmethod
+    def _parse_info(line: str) -> AnalysisResult:
+        """Parse a UCI ``info`` line into an AnalysisResult.
+
+        Uses ``str.find`` on the known keywords instead of tokenising the
+        whole line — info lines arrive at hundreds per second, and this
+        avoids allocating a token list per line.  The leading space in
+        each keyword keeps e.g. ``" depth "`` from matching "seldepth".
+        """
+        result = AnalysisResult()
+
+        i = line.find(" depth ")
+        if i >= 0:
+            result.depth = int(line[i + 7:].split(None, 1)[0])
+
+        i = line.find(" score cp ")
+        if i >= 0:
+            result.score_cp = int(line[i + 10:].split(None, 1)[0])
+            result.is_mate = False
+        else:
+            i = line.find(" score mate ")
+            if i >= 0:
+                val = int(line[i + 12:].split(None, 1)[0])
+                result.score_mate = val
+                result.is_mate = True
+                result.score_cp = 30000 if val > 0 else -30000
+
+        i = line.find(" nodes ")
+        if i >= 0:
+            result.nodes = int(line[i + 7:].split(None, 1)[0])
+
+        i = line.find(" nps ")
+        if i >= 0:
+            result.nps = int(line[i + 5:].split(None, 1)[0])
+
+        i = line.find(" pv ")
+        if i >= 0:
+            result.pv = line[i + 4:].split()
+            if result.pv:
+                result.best_move = result.pv[0]
+
+        return result
@@ -1,127 +1,162 @@
-"""
-Dorothy's Mind Games - Opponent Personas
-=========================================
-AI opponents with distinct personalities, configured via
-Stockfish UCI parameters.
-"""
-
-from __future__ import annotations
-
-from dataclasses import dataclass
-from enum import Enum, auto
-
-
-class PersonaType(Enum):
-    BERSERKER = auto()
-    GATEKEEPER = auto()
-    SHADOW_SELF = auto()
-    PRODIGY = auto()
-    ENDGAME_MASTER = auto()
-
-
-@dataclass(frozen=True)
-class OpponentPersona:
-    """Configuration for an AI opponent personality."""
-    name: str
-    persona_type: PersonaType
-    description: str
-    elo: int                     # UCI_Elo setting
-    contempt: int = 0            # how aggressively to avoid draws
-    skill_level: int = 20        # 0-20 Stockfish skill
-    move_time_ms: int = 2000     # time per move in milliseconds
-    opening_preference: str = "" # preferred opening (narrative flavour)
-    taunt_lines: tuple[str, ...] = ()
-
-    def uci_options(self) -> dict[str, str]:
-        """Return the UCI setoption commands for this persona."""
-        opts: dict[str, str] = {
-            "UCI_LimitStrength": "true",
-            "UCI_Elo": str(self.elo),
-            "Skill Level": str(self.skill_level),
-            "Contempt": str(self.contempt),
-        }
-        return opts
-
-
-# ── Pre-built Personas ──────────────────────────────────────────────
-BERSERKER = OpponentPersona(
-    name="The Berserker",
-    persona_type=PersonaType.BERSERKER,
-    description="A reckless attacker who sacrifices pieces for initiative.",
-    elo=1400,
-    contempt=100,
-    skill_level=10,
-    move_time_ms=1000,
-    opening_preference="King's Gambit / Sicilian Dragon",
-    taunt_lines=(
-        "You think too much. I act.",
-        "Every piece I sacrifice brings me closer to your King.",
-        "Hesitation is the first step to defeat.",
-    ),
-)
-
-GATEKEEPER = OpponentPersona(
-    name="The Gatekeeper",
-    persona_type=PersonaType.GATEKEEPER,
-    description="A fortress builder who grinds opponents in closed positions.",
-    elo=1600,
-    contempt=-50,
-    skill_level=14,
-    move_time_ms=3000,
-    opening_preference="London System / Caro-Kann",
-    taunt_lines=(
-        "Patience is the highest form of intelligence.",
-        "Your attack crumbles against my walls.",
-        "In time, even mountains erode. So will you.",
-    ),
-)
-
-SHADOW_SELF = OpponentPersona(
-    name="The Shadow Self",
-    persona_type=PersonaType.SHADOW_SELF,
-    description="A mirror that plays your own style back at you.",
-    elo=1800,
-    contempt=0,
-    skill_level=16,
-    move_time_ms=2000,
-    opening_preference="Mirror / Your favourite lines",
-    taunt_lines=(
-        "I know every move you'll make... because I am you.",
-        "You cannot defeat yourself, Dorothy.",
-        "Look into the board. Do you see me, or do you see you?",
-    ),
-)
-
-PRODIGY = OpponentPersona(
-    name="The Prodigy",
-    persona_type=PersonaType.PRODIGY,
-    description="A terrifyingly accurate child who sees 20 moves ahead.",
-    elo=2200,
-    contempt=0,
-    skill_level=20,
-    move_time_ms=2500,
-    opening_preference="Ruy Lopez / Nimzo-Indian",
-    taunt_lines=(
-        "Checkmate in twelve. You just don't see it yet.",
-        "Your moves are... adequate.",
-        "I solved this position before you sat down.",
-    ),
-)
-
-ENDGAME_MASTER = OpponentPersona(
-    name="The Endgame Master",
-    persona_type=PersonaType.ENDGAME_MASTER,
-    description="A patient ghost who thrives when the board empties.",
-    elo=1900,
-    contempt=-25,
-    skill_level=18,
-    move_time_ms=3500,
-    opening_preference="Queen's Gambit Declined / Endgame Tablebase",
-    taunt_lines=(
-        "The fewer the pieces, the louder the silence.",
-        "In the endgame, truth is revealed.",
-        "You trade pieces to simplify. I trade pieces to win.",
-    ),
-)
-
-ALL_PERSONAS: list[OpponentPersona] = [BERSERKER, GATEKEEPER, SHADOW_SELF, PRODIGY, ENDGAME_MASTER]
+"""
+Dorothy's Mind Games - Opponent Personas
+=========================================
+AI opponents with distinct personalities, configured via
+Stockfish UCI parameters.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Mapping
+
+
+# UCI option names, interned once so every persona's option dict shares
+# the same key objects (cached hashes, pointer-equality fast path).
+_UCI_KEY_LIMIT = sys.intern("UCI_LimitStrength")
+_UCI_KEY_ELO = sys.intern("UCI_Elo")
+_UCI_KEY_SKILL = sys.intern("Skill Level")
+_UCI_KEY_CONTEMPT = sys.intern("Contempt")
+
+
+class PersonaType(IntEnum):
+    # Explicit 0-based values so members double as indices into
+    # persona-keyed lookup tables; comparisons are plain int compares.
+    BERSERKER = 0
+    GATEKEEPER = 1
+    SHADOW_SELF = 2
+    PRODIGY = 3
+    ENDGAME_MASTER = 4
+
+
+@dataclass(frozen=True, slots=True)
+class OpponentPersona:
+    """Configuration for an AI opponent personality."""
+    name: str
+    persona_type: PersonaType
+    description: str
+    elo: int                     # UCI_Elo setting
+    contempt: int = 0            # how aggressively to avoid draws
+    skill_level: int = 20        # 0-20 Stockfish skill
+    move_time_ms: int = 2000     # time per move in milliseconds
+    opening_preference: str = "" # preferred opening (narrative flavour)
+    taunt_lines: tuple[str, ...] = ()
+
+    # Caches built in __post_init__; declared as fields so slots=True
+    # reserves their descriptors (there is no __dict__ to fall back on).
+    _uci_options: dict[str, str] = field(init=False, repr=False, compare=False)
+    _uci_options_view: Mapping[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Every field is immutable, so the option dict can be built once
+        # per persona instead of on every uci_options() call.
+        # object.__setattr__ sidesteps the frozen-dataclass guard.
+        object.__setattr__(self, "_uci_options", {
+            _UCI_KEY_LIMIT: "true",
+            _UCI_KEY_ELO: str(self.elo),
+            _UCI_KEY_SKILL: str(self.skill_level),
+            _UCI_KEY_CONTEMPT: str(self.contempt),
+        })
+        # Read-only view handed to callers, so nobody needs a defensive
+        # dict(...) copy before iterating.
+        object.__setattr__(
+            self, "_uci_options_view", MappingProxyType(self._uci_options)
+        )
+
+    def uci_options(self) -> Mapping[str, str]:
+        """Return the UCI setoption commands for this persona (read-only)."""
+        return self._uci_options_view
+
+
+# ── Pre-built Personas ──────────────────────────────────────────────
+BERSERKER = OpponentPersona(
+    name="The Berserker",
+    persona_type=PersonaType.BERSERKER,
+    description="A reckless attacker who sacrifices pieces for initiative.",
+    elo=1400,
+    contempt=100,
+    skill_level=10,
+    move_time_ms=1000,
+    opening_preference="King's Gambit / Sicilian Dragon",
+    taunt_lines=(
+        "You think too much. I act.",
+        "Every piece I sacrifice brings me closer to your King.",
+        "Hesitation is the first step to defeat.",
+    ),
+)
+
+GATEKEEPER = OpponentPersona(
+    name="The Gatekeeper",
+    persona_type=PersonaType.GATEKEEPER,
+    description="A fortress builder who grinds opponents in closed positions.",
+    elo=1600,
+    contempt=-50,
+    skill_level=14,
+    move_time_ms=3000,
+    opening_preference="London System / Caro-Kann",
+    taunt_lines=(
+        "Patience is the highest form of intelligence.",
+        "Your attack crumbles against my walls.",
+        "In time, even mountains erode. So will you.",
+    ),
+)
+
+SHADOW_SELF = OpponentPersona(
+    name="The Shadow Self",
+    persona_type=PersonaType.SHADOW_SELF,
+    description="A mirror that plays your own style back at you.",
+    elo=1800,
+    contempt=0,
+    skill_level=16,
+    move_time_ms=2000,
+    opening_preference="Mirror / Your favourite lines",
+    taunt_lines=(
+        "I know every move you'll make... because I am you.",
+        "You cannot defeat yourself, Dorothy.",
+        "Look into the board. Do you see me, or do you see you?",
+    ),
+)
+
+PRODIGY = OpponentPersona(
+    name="The Prodigy",
+    persona_type=PersonaType.PRODIGY,
+    description="A terrifyingly accurate child who sees 20 moves ahead.",
+    elo=2200,
+    contempt=0,
+    skill_level=20,
+    move_time_ms=2500,
+    opening_preference="Ruy Lopez / Nimzo-Indian",
+    taunt_lines=(
+        "Checkmate in twelve. You just don't see it yet.",
+        "Your moves are... adequate.",
+        "I solved this position before you sat down.",
+    ),
+)
+
+ENDGAME_MASTER = OpponentPersona(
+    name="The Endgame Master",
+    persona_type=PersonaType.ENDGAME_MASTER,
+    description="A patient ghost who thrives when the board empties.",
+    elo=1900,
+    contempt=-25,
+    skill_level=18,
+    move_time_ms=3500,
+    opening_preference="Queen's Gambit Declined / Endgame Tablebase",
+    taunt_lines=(
+        "The fewer the pieces, the louder the silence.",
+        "In the endgame, truth is revealed.",
+        "You trade pieces to simplify. I trade pieces to win.",
+    ),
+)
+
+ALL_PERSONAS: tuple[OpponentPersona, ...] = (
+    BERSERKER, GATEKEEPER, SHADOW_SELF, PRODIGY, ENDGAME_MASTER
+)
+
+# O(1) persona lookup; PersonaType values also index ALL_PERSONAS directly.
+PERSONA_BY_TYPE: dict[PersonaType, OpponentPersona] = {
+    p.persona_type: p for p in ALL_PERSONAS
+}
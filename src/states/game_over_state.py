@@ -1,109 +1,174 @@
-"""
-Dorothy's Mind Games - Game Over State
-=======================================
-Displays the final result: Heaven (victory), Hell (defeat),
-or the Void (draw / resource death).
-"""
-
-from __future__ import annotations
-
-import math
-from typing import TYPE_CHECKING
-
-import pygame
-
-from src.core.constants import (
-    COLOR_ACCENT,
-    COLOR_BG,
-    COLOR_DANGER,
-    COLOR_HEAVEN_TINT,
-    COLOR_HELL_TINT,
-    COLOR_TEXT,
-    COLOR_TEXT_DIM,
-    SCREEN_HEIGHT,
-    SCREEN_WIDTH,
-)
-
-if TYPE_CHECKING:
-    from src.core.state_manager import StateManager
-
-
-class GameOverState:
-    """Final results screen with thematic visuals."""
-
-    def __init__(
-        self,
-        state_manager: "StateManager",
-        result_text: str,
-        accuracy: float,
-        total_moves: int,
-        blunders: int,
-    ) -> None:
-        self._sm = state_manager
-        self._result_text = result_text
-        self._accuracy = accuracy
-        self._total_moves = total_moves
-        self._blunders = blunders
-        self._time: float = 0.0
-        self._is_victory = "HEAVEN" in result_text or "ASCENSION" in result_text
-
-    def enter(self) -> None:
-        pass
-
-    def exit(self) -> None:
-        pass
-
-    def handle_event(self, event: pygame.event.Event) -> None:
-        if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_ESCAPE, pygame.K_RETURN, pygame.K_SPACE):
-                from src.states.main_menu_state import MainMenuState
-                self._sm.switch(MainMenuState(self._sm))
-
-    def update(self, dt: float) -> None:
-        self._time += dt
-
-    def draw(self, surface: pygame.Surface) -> None:
-        # Background
-        if self._is_victory:
-            bg = COLOR_HEAVEN_TINT
-        else:
-            bg = COLOR_HELL_TINT
-        surface.fill(bg)
-
-        # Pulsing overlay
-        alpha = int(30 + 20 * math.sin(self._time * 2))
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((*COLOR_BG, alpha))
-        surface.blit(overlay, (0, 0))
-
-        font_big = pygame.font.SysFont("georgia", 44, bold=True)
-        font_md = pygame.font.SysFont("consolas", 22)
-        font_sm = pygame.font.SysFont("consolas", 16)
-
-        # Result
-        color = COLOR_ACCENT if self._is_victory else COLOR_DANGER
-        result = font_big.render(self._result_text, True, color)
-        surface.blit(result, (
-            SCREEN_WIDTH // 2 - result.get_width() // 2,
-            SCREEN_HEIGHT // 3 - 40,
-        ))
-
-        # Stats
-        stats_lines = [
-            f"Accuracy: {self._accuracy:.1f}%",
-            f"Total Moves: {self._total_moves}",
-            f"Blunders: {self._blunders}",
-        ]
-        for i, line in enumerate(stats_lines):
-            txt = font_md.render(line, True, COLOR_TEXT)
-            surface.blit(txt, (
-                SCREEN_WIDTH // 2 - txt.get_width() // 2,
-                SCREEN_HEIGHT // 2 + i * 36,
-            ))
-
-        # Hint
-        hint = font_sm.render("[ESC / ENTER] Return to Menu", True, COLOR_TEXT_DIM)
-        surface.blit(hint, (
-            SCREEN_WIDTH // 2 - hint.get_width() // 2,
-            SCREEN_HEIGHT - 80,
-        ))
+"""
+Dorothy's Mind Games - Game Over State
+=======================================
+Displays the final result: Heaven (victory), Hell (defeat),
+or the Void (draw / resource death).
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import pygame
+
+from src.core.constants import (
+    COLOR_ACCENT,
+    COLOR_BG,
+    COLOR_DANGER,
+    COLOR_HEAVEN_TINT,
+    COLOR_HELL_TINT,
+    COLOR_TEXT,
+    COLOR_TEXT_DIM,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+
+if TYPE_CHECKING:
+    from src.core.state_manager import StateManager
+
+
+# Lazily-bound MainMenuState class (circular import guard).  Resolved on
+# the first menu transition instead of re-running the import machinery on
+# every ESC/ENTER press.
+_MainMenuState = None
+
+
+# One sine period of overlay alpha (30 ± 20), quantised to 256 steps so
+# the per-frame pulse is a table lookup instead of a math.sin call.
+_ALPHA_LUT: tuple[int, ...] = tuple(
+    int(30 + 20 * math.sin(2 * math.pi * i / 256)) for i in range(256)
+)
+
+
+class GameOverState:
+    """Final results screen with thematic visuals."""
+
+    is_opaque = True
+
+    def __init__(
+        self,
+        state_manager: "StateManager",
+        result_text: str,
+        accuracy: float,
+        total_moves: int,
+        blunders: int,
+    ) -> None:
+        self._sm = state_manager
+        self._result_text = result_text
+        self._accuracy = accuracy
+        self._total_moves = total_moves
+        self._blunders = blunders
+        self._time: float = 0.0
+        self._is_victory = "HEAVEN" in result_text or "ASCENSION" in result_text
+
+        # Fonts (initialised in enter())
+        self._font_big: pygame.font.Font | None = None
+        self._font_md: pygame.font.Font | None = None
+        self._font_sm: pygame.font.Font | None = None
+
+        # Cached text surfaces (rendered in enter())
+        self._result_surf: pygame.Surface | None = None
+        self._result_pos: tuple[int, int] = (0, 0)
+        self._stats_surfs: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        self._hint_surf: pygame.Surface | None = None
+        self._hint_pos: tuple[int, int] = (0, 0)
+
+        # Reusable full-screen overlay for the pulsing tint
+        self._overlay: pygame.Surface | None = None
+        self._last_alpha: int = -1
+
+        # Fully composed static background (built in enter())
+        self._static: pygame.Surface | None = None
+        # Composite of background + overlay, rebuilt only when the
+        # pulse alpha actually changes
+        self._frame: pygame.Surface | None = None
+
+    def enter(self) -> None:
+        self._font_big = pygame.font.SysFont("georgia", 44, bold=True)
+        self._font_md = pygame.font.SysFont("consolas", 22)
+        self._font_sm = pygame.font.SysFont("consolas", 16)
+
+        # All text on this screen is static — rasterise it once here and
+        # just blit the cached surfaces each frame.
+        color = COLOR_ACCENT if self._is_victory else COLOR_DANGER
+        self._result_surf = self._font_big.render(self._result_text, True, color)
+        self._result_pos = (
+            SCREEN_WIDTH // 2 - self._result_surf.get_width() // 2,
+            SCREEN_HEIGHT // 3 - 40,
+        )
+
+        stats_lines = [
+            f"Accuracy: {self._accuracy:.1f}%",
+            f"Total Moves: {self._total_moves}",
+            f"Blunders: {self._blunders}",
+        ]
+        self._stats_surfs = []
+        for i, line in enumerate(stats_lines):
+            txt = self._font_md.render(line, True, COLOR_TEXT)
+            pos = (
+                SCREEN_WIDTH // 2 - txt.get_width() // 2,
+                SCREEN_HEIGHT // 2 + i * 36,
+            )
+            self._stats_surfs.append((txt, pos))
+
+        self._hint_surf = self._font_sm.render(
+            "[ESC / ENTER] Return to Menu", True, COLOR_TEXT_DIM
+        )
+        self._hint_pos = (
+            SCREEN_WIDTH // 2 - self._hint_surf.get_width() // 2,
+            SCREEN_HEIGHT - 80,
+        )
+
+        # Opaque overlay + surface alpha: constant-alpha blits take
+        # SDL's vectorised blitter, unlike per-pixel SRCALPHA blending.
+        self._overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._overlay.fill(COLOR_BG)
+
+        # Bake the tint fill and all cached text into one static frame —
+        # per-frame drawing is then just this blit plus the pulse.
+        bg = COLOR_HEAVEN_TINT if self._is_victory else COLOR_HELL_TINT
+        self._static = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._static.fill(bg)
+        # One blits() call walks the whole batch in C instead of paying
+        # Python dispatch per line.
+        self._static.blits(
+            [
+                (self._result_surf, self._result_pos),
+                *self._stats_surfs,
+                (self._hint_surf, self._hint_pos),
+            ],
+            doreturn=False,
+        )
+
+        self._frame = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._last_alpha = -1  # force composition on the first draw
+
+    def exit(self) -> None:
+        pass
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_ESCAPE, pygame.K_RETURN, pygame.K_SPACE):
+                global _MainMenuState
+                if _MainMenuState is None:
+                    from src.states.main_menu_state import MainMenuState as _MainMenuState
+                self._sm.switch(_MainMenuState(self._sm))
+
+    def update(self, dt: float) -> None:
+        self._time += dt
+
+    def draw(self, surface: pygame.Surface) -> None:
+        if self._static is None:
+            return
+
+        # Recompose background + overlay only on frames where the
+        # quantised pulse alpha moved; otherwise the cached composite is
+        # still valid and the screen costs a single blit.
+        alpha = _ALPHA_LUT[int(self._time * 2 * 256 / (2 * math.pi)) & 255]
+        if alpha != self._last_alpha:
+            self._overlay.set_alpha(alpha)
+            self._frame.blit(self._static, (0, 0))
+            self._frame.blit(self._overlay, (0, 0))
+            self._last_alpha = alpha
+        surface.blit(self._frame, (0, 0))
@@ -1,229 +1,334 @@
-"""
-Dorothy's Mind Games - How to Play State
-==========================================
-A lore-rich tutorial overlay that explains the core mechanics
-to the player.  Pushed on top of the Main Menu (the menu is
-still visible underneath, frozen).
-
-A single "BACK" button at the bottom pops this state and
-returns to the menu.
-"""
-
-from __future__ import annotations
-
-from typing import TYPE_CHECKING
-
-import pygame
-
-from src.core.constants import (
-    COLOR_ACCENT,
-    COLOR_BG,
-    COLOR_DANGER,
-    COLOR_TEXT,
-    COLOR_TEXT_DIM,
-    SCREEN_HEIGHT,
-    SCREEN_WIDTH,
-)
-from src.ui.elements import UIButton
-
-if TYPE_CHECKING:
-    from src.core.state_manager import StateManager
-
-
-# ── Tutorial content ────────────────────────────────────────────────
-# Each section is a (heading, body_lines) pair.
-_SECTIONS: list[tuple[str, list[str]]] = [
-    (
-        "THE MIND'S EYE",
-        [
-            "Sanity dictates your vision.  Think fast, or the board distorts.",
-            "As your mental stability drops, the UI begins to lie — evaluation",
-            "bars jitter, ghost arrows mislead, and reality frays at the edges.",
-        ],
-    ),
-    (
-        "THE BLUNDER AND LIMBO",
-        [
-            "Blunders (??) will drag you into Limbo.  Solve the chaos to escape.",
-            "A single move that loses 200+ centipawns shatters the board and",
-            "plunges Dorothy into a monochromatic nightmare dimension.  Solve",
-            "three tactical puzzles under time pressure — or be lost forever.",
-        ],
-    ),
-    (
-        "GENIUS VISION",
-        [
-            "Use Focus to see the Engine Lines, but beware the cost.",
-            "Press [G] or hold Right-Click to activate Genius Vision.",
-            "It reveals the best move, threat heat-maps, and future lines,",
-            "but every activation drains your Focus resource.",
-        ],
-    ),
-    (
-        "RESOURCES",
-        [
-            "SANITY  — Determines how reliable your interface is.",
-            "SOUL    — Your life force.  Spend it to Rewind time [R].",
-            "FOCUS   — Powers Genius Vision.  Regenerates each turn.",
-        ],
-    ),
-    (
-        "FLOW STATE",
-        [
-            "Play three consecutive best moves and enter the Flow State —",
-            "visuals sharpen, Focus regenerates rapidly, and the board hums",
-            "with the resonance of Heaven.",
-        ],
-    ),
-]
-
-_BACK_BTN_WIDTH = 200
-_BACK_BTN_HEIGHT = 46
-
-
-class HowToPlayState:
-    """Full-screen tutorial overlay with multi-section lore text."""
-
-    def __init__(self, state_manager: "StateManager") -> None:
-        self._sm = state_manager
-
-        # Fonts (initialised in enter())
-        self._font_title: pygame.font.Font | None = None
-        self._font_heading: pygame.font.Font | None = None
-        self._font_body: pygame.font.Font | None = None
-
-        # Back button
-        self._back_btn: UIButton | None = None
-
-        # Scroll / cosmetic
-        self._scroll_y: int = 0
-        self._max_scroll: int = 0
-
-    # ── Lifecycle ───────────────────────────────────────────────────
-    def enter(self) -> None:
-        self._font_title = pygame.font.SysFont("georgia", 40, bold=True)
-        self._font_heading = pygame.font.SysFont("consolas", 20, bold=True)
-        self._font_body = pygame.font.SysFont("consolas", 16)
-        self._scroll_y = 0
-
-        bx = SCREEN_WIDTH // 2 - _BACK_BTN_WIDTH // 2
-        by = SCREEN_HEIGHT - 70
-        self._back_btn = UIButton(
-            bx, by, _BACK_BTN_WIDTH, _BACK_BTN_HEIGHT, "BACK",
-            font=pygame.font.SysFont("consolas", 20),
-        )
-
-        # Pre-calculate content height so we know the scroll limit
-        self._max_scroll = self._content_height() - (SCREEN_HEIGHT - 180)
-        if self._max_scroll < 0:
-            self._max_scroll = 0
-
-    def exit(self) -> None:
-        pass
-
-    # ── Events ──────────────────────────────────────────────────────
-    def handle_event(self, event: pygame.event.Event) -> None:
-        if self._back_btn is not None and self._back_btn.is_clicked(event):
-            self._sm.pop()
-            return
-
-        if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_ESCAPE, pygame.K_BACKSPACE):
-                self._sm.pop()
-            elif event.key == pygame.K_UP:
-                self._scroll_y = max(0, self._scroll_y - 30)
-            elif event.key == pygame.K_DOWN:
-                self._scroll_y = min(self._max_scroll, self._scroll_y + 30)
-
-        # Mouse wheel scrolling
-        elif event.type == pygame.MOUSEWHEEL:
-            self._scroll_y -= event.y * 30
-            self._scroll_y = max(0, min(self._max_scroll, self._scroll_y))
-
-    # ── Update ──────────────────────────────────────────────────────
-    def update(self, dt: float) -> None:
-        if self._back_btn is not None:
-            self._back_btn.is_hovered(pygame.mouse.get_pos())
-
-    # ── Draw ────────────────────────────────────────────────────────
-    def draw(self, surface: pygame.Surface) -> None:
-        # Full-screen dark overlay (hides menu beneath)
-        surface.fill(COLOR_BG)
-
-        if not self._font_title or not self._font_heading or not self._font_body:
-            return
-
-        # ── Page title ──────────────────────────────────────────────
-        title = self._font_title.render("How to Play", True, COLOR_ACCENT)
-        surface.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 30))
-
-        # Thin divider under title
-        pygame.draw.line(
-            surface, COLOR_ACCENT,
-            (SCREEN_WIDTH // 2 - 180, 82),
-            (SCREEN_WIDTH // 2 + 180, 82),
-            1,
-        )
-
-        # ── Scrollable content area ─────────────────────────────────
-        content_top = 100
-        content_bottom = SCREEN_HEIGHT - 90
-        clip_rect = pygame.Rect(0, content_top, SCREEN_WIDTH, content_bottom - content_top)
-
-        # Create a sub-surface we can clip into
-        content_surf = pygame.Surface((SCREEN_WIDTH, content_bottom - content_top), pygame.SRCALPHA)
-        content_surf.fill((0, 0, 0, 0))
-
-        cursor_y = -self._scroll_y  # current draw-y inside the content surface
-        margin_x = 120
-
-        for heading, lines in _SECTIONS:
-            # Section heading
-            head_surf = self._font_heading.render(heading, True, COLOR_ACCENT)
-            content_surf.blit(head_surf, (margin_x, cursor_y))
-            cursor_y += head_surf.get_height() + 8
-
-            # Body lines
-            for line in lines:
-                body_surf = self._font_body.render(line, True, COLOR_TEXT)
-                content_surf.blit(body_surf, (margin_x + 12, cursor_y))
-                cursor_y += body_surf.get_height() + 4
-
-            # Gap between sections
-            cursor_y += 22
-
-        surface.blit(content_surf, (0, content_top))
-
-        # ── Scroll indicator ────────────────────────────────────────
-        if self._max_scroll > 0:
-            ratio = self._scroll_y / self._max_scroll
-            track_h = content_bottom - content_top
-            thumb_h = max(20, int(track_h * (track_h / (track_h + self._max_scroll))))
-            thumb_y = content_top + int(ratio * (track_h - thumb_h))
-            bar_x = SCREEN_WIDTH - 18
-            pygame.draw.rect(surface, (50, 48, 55), (bar_x, content_top, 6, track_h), border_radius=3)
-            pygame.draw.rect(surface, COLOR_ACCENT, (bar_x, thumb_y, 6, thumb_h), border_radius=3)
-
-        # ── Hint ────────────────────────────────────────────────────
-        hint = self._font_body.render(
-            "[ESC / BACK]  Return    [UP / DOWN / Scroll]  Navigate",
-            True, COLOR_TEXT_DIM,
-        )
-        surface.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, SCREEN_HEIGHT - 28))
-
-        # ── Back button ─────────────────────────────────────────────
-        if self._back_btn:
-            self._back_btn.draw(surface)
-
-    # ── Helpers ─────────────────────────────────────────────────────
-    def _content_height(self) -> int:
-        """Estimate the total pixel height of all sections."""
-        if not self._font_heading or not self._font_body:
-            return 0
-
-        h = 0
-        for heading, lines in _SECTIONS:
-            h += self._font_heading.get_linesize() + 8
-            h += len(lines) * (self._font_body.get_linesize() + 4)
-            h += 22
-        return h
+"""
+Dorothy's Mind Games - How to Play State
+==========================================
+A lore-rich tutorial overlay that explains the core mechanics
+to the player.  Pushed on top of the Main Menu (the menu is
+still visible underneath, frozen).
+
+A single "BACK" button at the bottom pops this state and
+returns to the menu.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+import pygame
+
+from src.core.constants import (
+    COLOR_ACCENT,
+    COLOR_BG,
+    COLOR_DANGER,
+    COLOR_TEXT,
+    COLOR_TEXT_DIM,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+from src.ui.elements import UIButton
+
+if TYPE_CHECKING:
+    from src.core.state_manager import StateManager
+
+
+# ── Tutorial content ────────────────────────────────────────────────
+# Each section is a (heading, body_lines) pair.  Frozen as tuples —
+# nothing mutates the content and tuple iteration is cheaper.
+_SECTIONS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    (
+        "THE MIND'S EYE",
+        (
+            "Sanity dictates your vision.  Think fast, or the board distorts.",
+            "As your mental stability drops, the UI begins to lie — evaluation",
+            "bars jitter, ghost arrows mislead, and reality frays at the edges.",
+        ),
+    ),
+    (
+        "THE BLUNDER AND LIMBO",
+        (
+            "Blunders (??) will drag you into Limbo.  Solve the chaos to escape.",
+            "A single move that loses 200+ centipawns shatters the board and",
+            "plunges Dorothy into a monochromatic nightmare dimension.  Solve",
+            "three tactical puzzles under time pressure — or be lost forever.",
+        ),
+    ),
+    (
+        "GENIUS VISION",
+        (
+            "Use Focus to see the Engine Lines, but beware the cost.",
+            "Press [G] or hold Right-Click to activate Genius Vision.",
+            "It reveals the best move, threat heat-maps, and future lines,",
+            "but every activation drains your Focus resource.",
+        ),
+    ),
+    (
+        "RESOURCES",
+        (
+            "SANITY  — Determines how reliable your interface is.",
+            "SOUL    — Your life force.  Spend it to Rewind time [R].",
+            "FOCUS   — Powers Genius Vision.  Regenerates each turn.",
+        ),
+    ),
+    (
+        "FLOW STATE",
+        (
+            "Play three consecutive best moves and enter the Flow State —",
+            "visuals sharpen, Focus regenerates rapidly, and the board hums",
+            "with the resonance of Heaven.",
+        ),
+    ),
+)
+
+_BACK_BTN_WIDTH = 200
+_BACK_BTN_HEIGHT = 46
+
+# Event/key codes bound once — handle_event sees bursts under key
+# repeat and shouldn't pay a pygame attribute lookup per comparison.
+_KEYDOWN = pygame.KEYDOWN
+_MOUSEWHEEL = pygame.MOUSEWHEEL
+_K_ESCAPE = pygame.K_ESCAPE
+_K_BACKSPACE = pygame.K_BACKSPACE
+_K_UP = pygame.K_UP
+_K_DOWN = pygame.K_DOWN
+
+
+@functools.lru_cache(maxsize=32)
+def _sys_font(name: str, size: int, bold: bool = False) -> pygame.font.Font:
+    """SysFont, cached by (name, size, bold).
+
+    Re-entering the overlay reuses the parsed font objects instead of
+    re-scanning the system font directory and re-opening the .ttf each
+    time.
+    """
+    return pygame.font.SysFont(name, size, bold=bold)
+
+
+class HowToPlayState:
+    """Full-screen tutorial overlay with multi-section lore text."""
+
+    is_opaque = True  # fills the window despite sitting on the menu
+
+    # ── Shared static caches ────────────────────────────────────────
+    # The overlay's content is identical for every instance, so the
+    # fonts, baked surfaces, geometry, and back button are built on the
+    # first enter() and reused by all later openings of the screen.
+    _font_title: pygame.font.Font | None = None
+    _font_heading: pygame.font.Font | None = None
+    _font_body: pygame.font.Font | None = None
+    _back_btn: UIButton | None = None
+    _title_surf: pygame.Surface | None = None
+    _hint_surf: pygame.Surface | None = None
+    _static_bg: pygame.Surface | None = None
+    _blit_list: list[tuple[pygame.Surface, tuple[int, int]]] = []
+    _full_content: pygame.Surface | None = None
+    _content_h: int = 0
+    _max_scroll: int = 0
+    _track_top: int = 0
+    _track_h: int = 0
+    _thumb_h: int = 0
+    _bar_x: int = 0
+    _track_img: pygame.Surface | None = None
+    _thumb_img: pygame.Surface | None = None
+
+    def __init__(self, state_manager: "StateManager") -> None:
+        self._sm = state_manager
+
+        # Per-instance view state
+        self._scroll_y: int = 0
+        self._last_mouse: tuple[int, int] = (-1, -1)
+        self._last_hover: bool = False
+        # Composed-frame cache: the screen only changes on scroll or
+        # hover, so identical frames are replayed from a copy.
+        self._dirty: bool = True
+        self._frame: pygame.Surface | None = None
+
+    # ── Lifecycle ───────────────────────────────────────────────────
+    def enter(self) -> None:
+        self._scroll_y = 0
+        self._dirty = True
+        if HowToPlayState._full_content is None:
+            self._build_static_caches()
+
+    @classmethod
+    def _build_static_caches(cls) -> None:
+        """One-time rasterisation and layout shared by all instances."""
+        cls._font_title = _sys_font("georgia", 40, bold=True)
+        cls._font_heading = _sys_font("consolas", 20, bold=True)
+        cls._font_body = _sys_font("consolas", 16)
+
+        bx = SCREEN_WIDTH // 2 - _BACK_BTN_WIDTH // 2
+        by = SCREEN_HEIGHT - 70
+        cls._back_btn = UIButton(
+            bx, by, _BACK_BTN_WIDTH, _BACK_BTN_HEIGHT, "BACK",
+            font=_sys_font("consolas", 20),
+        )
+
+        # Rasterise all static text once — this state re-renders nothing
+        # per frame, it only re-blits.
+        cls._title_surf = cls._font_title.render("How to Play", True, COLOR_ACCENT)
+        cls._hint_surf = cls._font_body.render(
+            "[ESC / BACK]  Return    [UP / DOWN / Scroll]  Navigate",
+            True, COLOR_TEXT_DIM,
+        )
+        cls._blit_list = []
+        cursor_y = 0
+        margin_x = 120
+        for heading, lines in _SECTIONS:
+            head_surf = cls._font_heading.render(heading, True, COLOR_ACCENT)
+            cls._blit_list.append((head_surf, (margin_x, cursor_y)))
+            cursor_y += head_surf.get_height() + 8
+            for line in lines:
+                body_surf = cls._font_body.render(line, True, COLOR_TEXT)
+                cls._blit_list.append((body_surf, (margin_x + 12, cursor_y)))
+                cursor_y += body_surf.get_height() + 4
+            cursor_y += 22
+
+        # Total height falls out of the layout pass — no second walk
+        # over the sections needed.
+        cls._content_h = cursor_y
+
+        # Composite everything once onto a tall atlas surface.  The
+        # content sits on a solid COLOR_BG fill, so an opaque convert()
+        # surface keeps the per-frame blit on SDL's fast 32-bit path
+        # instead of the per-pixel SRCALPHA blender.
+        cls._full_content = pygame.Surface((SCREEN_WIDTH, max(cursor_y, 1))).convert()
+        cls._full_content.fill(COLOR_BG)
+        # Whole batch in one C call rather than a Python blit per line.
+        cls._full_content.fblits(cls._blit_list)
+
+        # Scroll limit from the measured content height
+        cls._max_scroll = cls._content_h - (SCREEN_HEIGHT - 180)
+        if cls._max_scroll < 0:
+            cls._max_scroll = 0
+
+        # Scrollbar geometry — everything but the thumb's y is fixed.
+        cls._track_top = 100
+        cls._track_h = (SCREEN_HEIGHT - 90) - cls._track_top
+        cls._thumb_h = (
+            max(20, int(cls._track_h * (cls._track_h / (cls._track_h + cls._max_scroll))))
+            if cls._max_scroll > 0 else 0
+        )
+        cls._bar_x = SCREEN_WIDTH - 18
+
+        # Rounded track/thumb rendered once; per frame they are two
+        # tiny blits instead of two anti-aliased rect rasterisations.
+        if cls._max_scroll > 0:
+            cls._track_img = pygame.Surface((6, cls._track_h), pygame.SRCALPHA)
+            pygame.draw.rect(
+                cls._track_img, (50, 48, 55), (0, 0, 6, cls._track_h), border_radius=3
+            )
+            cls._thumb_img = pygame.Surface((6, cls._thumb_h), pygame.SRCALPHA)
+            pygame.draw.rect(
+                cls._thumb_img, COLOR_ACCENT, (0, 0, 6, cls._thumb_h), border_radius=3
+            )
+
+        # Bake the frame furniture: one opaque blit replaces the fill,
+        # the title and hint blits, and the divider line every frame.
+        cls._static_bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        cls._static_bg.fill(COLOR_BG)
+        cls._static_bg.blit(
+            cls._title_surf,
+            (SCREEN_WIDTH // 2 - cls._title_surf.get_width() // 2, 30),
+        )
+        pygame.draw.line(
+            cls._static_bg, COLOR_ACCENT,
+            (SCREEN_WIDTH // 2 - 180, 82),
+            (SCREEN_WIDTH // 2 + 180, 82),
+            1,
+        )
+        cls._static_bg.blit(
+            cls._hint_surf,
+            (SCREEN_WIDTH // 2 - cls._hint_surf.get_width() // 2, SCREEN_HEIGHT - 28),
+        )
+
+    def exit(self) -> None:
+        pass
+
+    # ── Events ──────────────────────────────────────────────────────
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if self._back_btn is not None and self._back_btn.is_clicked(event):
+            self._sm.pop()
+            return
+
+        handler = self._EVENT_HANDLERS.get(event.type)
+        if handler is not None:
+            handler(self, event)
+
+    def _on_keydown(self, event: pygame.event.Event) -> None:
+        if event.key in (_K_ESCAPE, _K_BACKSPACE):
+            self._sm.pop()
+        elif event.key == _K_UP:
+            self._scroll_by(-30)
+        elif event.key == _K_DOWN:
+            self._scroll_by(30)
+
+    def _on_wheel(self, event: pygame.event.Event) -> None:
+        self._scroll_by(-event.y * 30)
+
+    _EVENT_HANDLERS = {
+        _KEYDOWN: _on_keydown,
+        _MOUSEWHEEL: _on_wheel,
+    }
+
+    def _scroll_by(self, dy: int) -> None:
+        """Apply a scroll delta, clamped to [0, max] without min()/max()."""
+        sy = self._scroll_y + dy
+        ms = self._max_scroll
+        self._scroll_y = 0 if sy < 0 else ms if sy > ms else sy
+        self._dirty = True
+
+    # ── Update ──────────────────────────────────────────────────────
+    def update(self, dt: float) -> None:
+        # Hover state can only change when the cursor moves; skip the
+        # probe on the (common) idle frames.
+        pos = pygame.mouse.get_pos()
+        if pos != self._last_mouse:
+            self._last_mouse = pos
+            if self._back_btn is not None:
+                hovered = bool(self._back_btn.is_hovered(pos))
+                if hovered != self._last_hover:
+                    self._last_hover = hovered
+                    self._dirty = True
+
+    # ── Draw ────────────────────────────────────────────────────────
+    def draw(self, surface: pygame.Surface) -> None:
+        if self._static_bg is None:
+            return
+
+        # Replay the cached frame while nothing has changed
+        if not self._dirty and self._frame is not None:
+            surface.blit(self._frame, (0, 0))
+            return
+
+        # Background, title, divider, and hint in one opaque blit
+        surface.blit(self._static_bg, (0, 0))
+
+        # ── Scrollable content area ─────────────────────────────────
+        # One sub-rect blit from the pre-composited atlas; the area
+        # argument doubles as the viewport clip.
+        content_top = 100
+        content_bottom = SCREEN_HEIGHT - 90
+        surface.blit(
+            self._full_content,
+            (0, content_top),
+            area=pygame.Rect(0, self._scroll_y, SCREEN_WIDTH, content_bottom - content_top),
+        )
+
+        # ── Scroll indicator ────────────────────────────────────────
+        if self._max_scroll > 0:
+            ratio = self._scroll_y / self._max_scroll
+            thumb_y = self._track_top + int(ratio * (self._track_h - self._thumb_h))
+            surface.blit(self._track_img, (self._bar_x, self._track_top))
+            surface.blit(self._thumb_img, (self._bar_x, thumb_y))
+
+        # ── Back button ─────────────────────────────────────────────
+        if self._back_btn:
+            self._back_btn.draw(surface)
+
+        self._frame = surface.copy()
+        self._dirty = False
+
+    # ── Helpers ─────────────────────────────────────────────────────
+    def _content_height(self) -> int:
+        """Total pixel height of all sections (measured during enter())."""
+        return self._content_h
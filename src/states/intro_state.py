@@ -1,721 +1,1015 @@
-"""
-PixelLab-powered intro cinematic for Dorothy's Mind Games.
-
-This version uses generated PixelLab character sprites and composes them
-into a fully scripted four-scene intro with strict ordering, typewriter text,
-and atmospheric transitions.
-"""
-
-from __future__ import annotations
-
-from dataclasses import dataclass
-from io import BytesIO
-from pathlib import Path
-from typing import TYPE_CHECKING
-import math
-import random
-import urllib.request
-
-import pygame
-
-from src.core.constants import COLOR_BG, SCREEN_HEIGHT, SCREEN_WIDTH
-
-if TYPE_CHECKING:
-    from src.core.state_manager import StateManager
-
-
-# -------------------- Visual palette --------------------
-MIDNIGHT_TOP = (6, 12, 30)
-MIDNIGHT_BOTTOM = (18, 30, 62)
-STAGE_DARK = (10, 10, 16)
-NEON_CYAN = (86, 224, 255)
-BLOOD_RED = (186, 30, 56)
-WINDOW_YELLOW = (236, 206, 115)
-TEXT_WHITE = (238, 244, 255)
-OFF_WHITE = (236, 240, 248)
-SHADOW = (12, 12, 16)
-
-
-# -------------------- Narrative script --------------------
-# (time_from_scene_start, speaker, line)
-DIALOGUE_CUES: dict[str, list[tuple[float, str, str]]] = {
-    "exterior": [
-        (0.2, "NARRATOR", "On this night, the impossible happened. The Titan fell."),
-    ],
-    "defeat": [
-        (1.8, "SYSTEM", "Queen to H8. Checkmate."),
-        (3.4, "NARRATOR", "Silence. Then the crowd erupted like thunder."),
-        (5.2, "NARRATOR", "The Grandmaster laughed—proud, relieved, and free."),
-    ],
-    "warning": [
-        (0.8, "GRANDMASTER", "...Finally. I am free of it."),
-        (2.3, "DOROTHY", "Free?"),
-        (3.3, "GRANDMASTER", "They cheer for you now, little genius. They see the crown."),
-        (5.2, "GRANDMASTER", "They do not see the weight."),
-        (6.3, "GRANDMASTER", "It is easy to climb. It is terrifying to stay at the summit."),
-    ],
-    "fracture": [
-        (1.0, "GRANDMASTER", "Now you must face the burden of being No. 1."),
-        (3.3, "VOICE", "Try to keep your Sanity. Only your moves will prevail now."),
-    ],
-}
-
-
-# -------------------- PixelLab sprite URLs --------------------
-# Pulled from the generated character outputs in this session.
-DOROTHY_URLS: dict[str, str] = {
-    "west": "https://backblaze.pixellab.ai/file/pixellab-characters/4540cfab-6348-4db3-a492-6c55e0b1c37e/64c63f37-31fa-4af3-b9c2-80091ab2fc82/rotations/west.png?t=1771147884581",
-    "east": "https://backblaze.pixellab.ai/file/pixellab-characters/4540cfab-6348-4db3-a492-6c55e0b1c37e/64c63f37-31fa-4af3-b9c2-80091ab2fc82/rotations/east.png?t=1771147884581",
-    "north-west": "https://backblaze.pixellab.ai/file/pixellab-characters/4540cfab-6348-4db3-a492-6c55e0b1c37e/64c63f37-31fa-4af3-b9c2-80091ab2fc82/rotations/north-west.png?t=1771147884581",
-    "north-east": "https://backblaze.pixellab.ai/file/pixellab-characters/4540cfab-6348-4db3-a492-6c55e0b1c37e/64c63f37-31fa-4af3-b9c2-80091ab2fc82/rotations/north-east.png?t=1771147884581",
-}
-
-GRANDMASTER_URLS: dict[str, str] = {
-    "west": "https://backblaze.pixellab.ai/file/pixellab-characters/4540cfab-6348-4db3-a492-6c55e0b1c37e/9b7d7e79-37f0-4177-9946-f8f1ea9fba40/rotations/west.png?t=1771147884628",
-    "east": "https://backblaze.pixellab.ai/file/pixellab-characters/4540cfab-6348-4db3-a492-6c55e0b1c37e/9b7d7e79-37f0-4177-9946-f8f1ea9fba40/rotations/east.png?t=1771147884628",
-    "north-west": "https://backblaze.pixellab.ai/file/pixellab-characters/4540cfab-6348-4db3-a492-6c55e0b1c37e/9b7d7e79-37f0-4177-9946-f8f1ea9fba40/rotations/north-west.png?t=1771147884628",
-    "north-east": "https://backblaze.pixellab.ai/file/pixellab-characters/4540cfab-6348-4db3-a492-6c55e0b1c37e/9b7d7e79-37f0-4177-9946-f8f1ea9fba40/rotations/north-east.png?t=1771147884628",
-}
-
-# PixelLab-generated background tilesets (4x4 sheet, 16x16 each tile)
-EXTERIOR_TILESET_URL = "https://api.pixellab.ai/mcp/tilesets/09a6e07d-b565-40fd-aa05-a0e6466a5467/image"
-STAGE_TILESET_URL = "https://api.pixellab.ai/mcp/tilesets/5681e9c1-0d4f-45f8-aaac-eba34b5cbaac/image"
-VOID_TILESET_URL = "https://api.pixellab.ai/mcp/tilesets/d20a6544-e213-4640-9be7-2994da8733d5/image"
-
-
-# -------------------- Helpers --------------------
-def clamp01(v: float) -> float:
-    return max(0.0, min(1.0, v))
-
-
-def ease(t: float) -> float:
-    t = clamp01(t)
-    return t * t * (3.0 - 2.0 * t)
-
-
-def lerp(a: float, b: float, t: float) -> float:
-    return a + (b - a) * clamp01(t)
-
-
-def lerp_color(a: tuple[int, int, int], b: tuple[int, int, int], t: float) -> tuple[int, int, int]:
-    return (
-        int(lerp(a[0], b[0], t)),
-        int(lerp(a[1], b[1], t)),
-        int(lerp(a[2], b[2], t)),
-    )
-
-
-def build_gradient(height: int, top: tuple[int, int, int], bottom: tuple[int, int, int]) -> pygame.Surface:
-    surf = pygame.Surface((SCREEN_WIDTH, height), pygame.SRCALPHA)
-    for y in range(height):
-        t = y / max(1, height - 1)
-        col = lerp_color(top, bottom, t)
-        pygame.draw.line(surf, col, (0, y), (SCREEN_WIDTH, y))
-    return surf
-
-
-def load_pixel_font(size: int) -> pygame.font.Font:
-    candidates = [
-        Path(r"D:\Nick-Works\dorothy's_MindGames\src\assets\fonts\PressStart2P-Regular.ttf"),
-        Path(r"D:\Nick-Works\dorothy's_MindGames\assets\fonts\PressStart2P-Regular.ttf"),
-        Path(r"D:\Nick-Works\dorothy's_MindGames\src\assets\fonts\Silver.ttf"),
-        Path(r"D:\Nick-Works\dorothy's_MindGames\assets\fonts\Silver.ttf"),
-    ]
-    for path in candidates:
-        if path.exists():
-            return pygame.font.Font(str(path), size)
-    return pygame.font.SysFont("consolas", size, bold=False)
-
-
-def load_image_from_url(url: str, timeout: float = 8.0) -> pygame.Surface | None:
-    try:
-        req = urllib.request.Request(
-            url,
-            headers={
-                "User-Agent": "DorothyMindGames/1.0",
-                "Accept": "image/png,image/*;q=0.8,*/*;q=0.5",
-            },
-        )
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            data = response.read()
-        image = pygame.image.load(BytesIO(data)).convert_alpha()
-        return image
-    except Exception:
-        return None
-
-
-@dataclass(frozen=True)
-class Scene:
-    name: str
-    duration: float
-    transition: float
-
-
-@dataclass
-class Snow:
-    x: float
-    y: float
-    vy: float
-    vx: float
-    alpha: int
-    size: int
-
-
-class SceneManager:
-    """Strictly sequential scene controller."""
-
-    def __init__(self) -> None:
-        self._timeline = [
-            Scene("exterior", 9.0, 1.2),
-            Scene("defeat", 8.5, 1.1),
-            Scene("warning", 9.0, 1.4),
-            Scene("fracture", 9.5, 0.0),
-        ]
-        self._index = 0
-        self._scene_t = 0.0
-        self._global_t = 0.0
-
-    @property
-    def name(self) -> str:
-        return self._timeline[self._index].name
-
-    @property
-    def scene_time(self) -> float:
-        return self._scene_t
-
-    @property
-    def scene_progress(self) -> float:
-        d = self._timeline[self._index].duration
-        if d <= 0:
-            return 1.0
-        return clamp01(self._scene_t / d)
-
-    @property
-    def transition_progress(self) -> float:
-        scene = self._timeline[self._index]
-        if scene.transition <= 0:
-            return 0.0
-        start = max(0.0, scene.duration - scene.transition)
-        if self._scene_t <= start:
-            return 0.0
-        return clamp01((self._scene_t - start) / scene.transition)
-
-    @property
-    def global_time(self) -> float:
-        return self._global_t
-
-    def update(self, dt: float) -> bool:
-        self._global_t += dt
-        self._scene_t += dt
-        scene = self._timeline[self._index]
-        if self._scene_t < scene.duration:
-            return False
-        if self._index < len(self._timeline) - 1:
-            self._index += 1
-            self._scene_t = 0.0
-            return True
-        return False
-
-
-class Typewriter:
-    def __init__(self, cps: float = 22.0) -> None:
-        self._cps = cps
-        self._text = ""
-        self._elapsed = 0.0
-
-    def set_text(self, text: str) -> None:
-        if text != self._text:
-            self._text = text
-            self._elapsed = 0.0
-
-    def update(self, dt: float) -> None:
-        self._elapsed += dt
-
-    @property
-    def text(self) -> str:
-        n = int(self._elapsed * self._cps)
-        n = max(0, min(n, len(self._text)))
-        return self._text[:n]
-
-
-class IntroState:
-    """PixelLab-quality intro state."""
-
-    def __init__(self, state_manager: "StateManager") -> None:
-        self._sm = state_manager
-        self._scene = SceneManager()
-        self._typewriter = Typewriter(22.0)
-        self._speaker = "NARRATOR"
-        self._line = ""
-        self._title_alpha = 0
-        self._can_continue = False
-        self._clack_flash = 0.0
-
-        # layers
-        self._world = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        self._fx = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        self._story = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)  # dedicated story layer
-
-        self._rng = random.Random(1337)
-        self._snow: list[Snow] = []
-
-        self._font_dialogue: pygame.font.Font | None = None
-        self._font_speaker: pygame.font.Font | None = None
-        self._font_title: pygame.font.Font | None = None
-        self._font_hint: pygame.font.Font | None = None
-
-        # PixelLab sprites
-        self._dorothy: dict[str, pygame.Surface] = {}
-        self._grandmaster: dict[str, pygame.Surface] = {}
-        self._bg_sheets: dict[str, pygame.Surface] = {}
-        self._bg_tiles: dict[str, list[pygame.Surface]] = {}
-        self._assets_ready = False
-
-    def enter(self) -> None:
-        self._font_dialogue = load_pixel_font(26)
-        self._font_speaker = load_pixel_font(22)
-        self._font_title = load_pixel_font(72)
-        self._font_hint = load_pixel_font(16)
-        self._set_dialogue("NARRATOR", "On this night, the impossible happened. The Titan fell.")
-        self._init_snow()
-        self._load_pixellab_assets()
-
-    def exit(self) -> None:
-        pass
-
-    def handle_event(self, event: pygame.event.Event) -> None:
-        if event.type != pygame.KEYDOWN:
-            return
-        if event.key == pygame.K_ESCAPE:
-            self._go_to_menu()
-            return
-        if self._can_continue:
-            self._go_to_menu()
-
-    def update(self, dt: float) -> None:
-        changed = self._scene.update(dt)
-        self._typewriter.update(dt)
-        self._update_snow(dt)
-        self._clack_flash = max(0.0, self._clack_flash - dt)
-
-        if changed:
-            self._set_dialogue("", "")
-
-        self._update_dialogue_timeline()
-
-        if self._scene.name == "defeat" and 2.0 < self._scene.scene_time < 2.2 and self._clack_flash <= 0:
-            self._clack_flash = 0.22
-
-        if self._scene.name == "fracture":
-            if self._scene.scene_progress > 0.35:
-                self._title_alpha = int(255 * ease((self._scene.scene_progress - 0.35) / 0.5))
-            if self._scene.scene_progress > 0.88:
-                self._can_continue = True
-
-    def draw(self, surface: pygame.Surface) -> None:
-        self._world.fill((0, 0, 0, 0))
-        self._fx.fill((0, 0, 0, 0))
-        self._story.fill((0, 0, 0, 0))
-
-        if self._scene.name == "exterior":
-            self._draw_scene_exterior()
-        elif self._scene.name == "defeat":
-            self._draw_scene_defeat()
-        elif self._scene.name == "warning":
-            self._draw_scene_warning()
-        else:
-            self._draw_scene_fracture()
-
-        self._draw_transition()
-        self._draw_story_layer()
-        self._draw_hint()
-
-        surface.fill(COLOR_BG)
-        surface.blit(self._world, (0, 0))
-        surface.blit(self._fx, (0, 0))
-        surface.blit(self._story, (0, 0))
-
-    # -------------------- Scene render --------------------
-    def _draw_scene_exterior(self) -> None:
-        self._world.blit(build_gradient(SCREEN_HEIGHT, MIDNIGHT_TOP, MIDNIGHT_BOTTOM), (0, 0))
-        # Base and depth layers from PixelLab exterior tiles
-        self._draw_tiled_layer(self._world, "exterior", scale=20, alpha=150, seed_shift=1)
-        self._draw_tiled_layer(self._fx, "exterior", scale=14, alpha=70, seed_shift=2)
-        self._draw_film_grain(18)
-
-        # Hall silhouette now textured with PixelLab exterior tiles
-        hall_main = [(180, 590), (320, 190), (980, 190), (1100, 590)]
-        hall_inner = [(260, 570), (395, 280), (900, 280), (1010, 570)]
-        roof = [(248, 252), (640, 110), (1032, 252)]
-        tower_l = [(310, 255), (372, 255), (360, 122), (322, 122)]
-        tower_r = [(910, 255), (972, 255), (958, 136), (920, 136)]
-        self._draw_textured_polygon(self._world, "exterior", hall_main, scale=14, alpha=220, seed_shift=3)
-        self._draw_textured_polygon(self._world, "exterior", hall_inner, scale=12, alpha=210, seed_shift=4)
-        self._draw_textured_polygon(self._world, "exterior", roof, scale=12, alpha=225, seed_shift=5)
-        self._draw_textured_polygon(self._world, "exterior", tower_l, scale=10, alpha=225, seed_shift=6)
-        self._draw_textured_polygon(self._world, "exterior", tower_r, scale=10, alpha=225, seed_shift=7)
-
-        # crisp silhouette and readable sign so hall is unmistakable
-        pygame.draw.polygon(self._fx, (4, 8, 16, 210), hall_main, 3)
-        sign_rect = pygame.Rect(470, 360, 340, 72)
-        pygame.draw.rect(self._fx, (222, 232, 246, 235), sign_rect, border_radius=4)
-        pygame.draw.rect(self._fx, (28, 40, 62, 255), sign_rect, 2, border_radius=4)
-        if self._font_hint:
-            s1 = self._font_hint.render("WORLD CHESS", True, (24, 34, 58))
-            s2 = self._font_hint.render("CHAMPIONSHIP", True, (24, 34, 58))
-            self._fx.blit(s1, (sign_rect.centerx - s1.get_width() // 2, sign_rect.y + 14))
-            self._fx.blit(s2, (sign_rect.centerx - s2.get_width() // 2, sign_rect.y + 38))
-
-        # Window slits with glow
-        for i in range(10):
-            y = 306 + i * 20
-            glow = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.line(glow, (255, 220, 132, 62), (502, y), (778, y), 4)
-            pygame.draw.line(self._world, WINDOW_YELLOW, (506, y), (774, y), 2)
-            self._fx.blit(glow, (0, 0))
-
-        # Ground
-        pygame.draw.polygon(self._world, (10, 14, 24), [(0, 558), (1280, 558), (1280, 720), (0, 720)])
-        pygame.draw.polygon(self._world, (14, 18, 28), [(420, 558), (860, 558), (770, 720), (510, 720)])
-
-        # Spotlights
-        spot = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.polygon(spot, (120, 220, 255, 36), [(130, 545), (352, 196), (500, 196)])
-        pygame.draw.polygon(spot, (120, 220, 255, 36), [(1150, 545), (780, 196), (928, 196)])
-        self._fx.blit(spot, (0, 0))
-
-        self._draw_snow()
-
-    def _draw_scene_defeat(self) -> None:
-        self._world.blit(build_gradient(SCREEN_HEIGHT, (8, 10, 18), (24, 18, 28)), (0, 0))
-        self._draw_tiled_layer(self._world, "stage", scale=16, alpha=170, seed_shift=20)
-        self._draw_film_grain(12)
-
-        # Dark stage + spotlight
-        pygame.draw.polygon(self._world, (20, 14, 20), [(220, 548), (1060, 548), (1240, 720), (40, 720)])
-        spot = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.polygon(spot, (255, 255, 255, 68), [(640, 28), (484, 542), (796, 542)])
-        pygame.draw.polygon(spot, (255, 255, 255, 32), [(640, 28), (430, 640), (850, 640)])
-        self._fx.blit(spot, (0, 0))
-
-        # Table / board
-        table_poly = [(494, 522), (786, 522), (740, 616), (540, 616)]
-        board_poly = [(556, 506), (724, 506), (697, 564), (583, 564)]
-        self._draw_textured_polygon(self._world, "stage", table_poly, scale=10, alpha=230, seed_shift=21)
-        self._draw_textured_polygon(self._world, "stage", board_poly, scale=8, alpha=235, seed_shift=22)
-        self._draw_board_lines(board_poly)
-
-        # Handshake action
-        shake_y = int(470 + math.sin(self._scene.scene_time * 2.4) * 1.8)
-        self._draw_character("dorothy", "east", (470, 476), scale=4.5)
-        laugh_shake = int(math.sin(self._scene.scene_time * 21.0) * 4) if self._scene.scene_time > 2.1 else 0
-        self._draw_character("grandmaster", "west", (760, 458 + laugh_shake), scale=4.8)
-        pygame.draw.line(self._fx, OFF_WHITE, (565, shake_y), (706, shake_y - 8), 3)
-
-        # Piece move + clack flash
-        piece_t = ease(min(1.0, self._scene.scene_time / 2.0))
-        px = int(lerp(592, 664, piece_t))
-        pygame.draw.polygon(self._fx, (220, 232, 250, 220), [(px, 530), (px + 8, 517), (px + 16, 530), (px + 8, 542)])
-
-        if self._clack_flash > 0:
-            flash = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            flash.fill((255, 255, 255, int(125 * (self._clack_flash / 0.22))))
-            self._fx.blit(flash, (0, 0))
-
-    def _draw_scene_warning(self) -> None:
-        self._world.blit(build_gradient(SCREEN_HEIGHT, (30, 8, 18), (70, 10, 22)), (0, 0))
-        self._draw_tiled_layer(self._world, "void", scale=14, alpha=150, seed_shift=30)
-        self._draw_tiled_layer(self._fx, "stage", scale=12, alpha=80, seed_shift=31)
-        self._draw_film_grain(20)
-
-        # fracture shards
-        pygame.draw.polygon(self._world, (92, 20, 34), [(0, 186), (420, 142), (365, 236), (0, 274)])
-        pygame.draw.polygon(self._world, (92, 20, 34), [(1280, 144), (878, 196), (912, 284), (1280, 250)])
-        pygame.draw.polygon(self._world, (92, 20, 34), [(250, 490), (640, 434), (716, 562), (290, 606)])
-
-        # frozen stance
-        self._draw_character("dorothy", "east", (490, 486), scale=4.5)
-        self._draw_character("grandmaster", "west", (760, 458), scale=4.8, silhouette=True)
-
-        # glitch row offset (pulsed, not constant)
-        if int(self._scene.global_time * 5) % 3 == 0:
-            src = self._world.copy()
-            self._world.fill((0, 0, 0, 0))
-            row_h = 4
-            for y in range(0, SCREEN_HEIGHT, row_h):
-                dx = random.randint(-18, 18) if random.random() < 0.28 else 0
-                rect = pygame.Rect(0, y, SCREEN_WIDTH, min(row_h, SCREEN_HEIGHT - y))
-                self._world.blit(src, (dx, y), rect)
-
-        red_wash = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        red_wash.fill((BLOOD_RED[0], BLOOD_RED[1], BLOOD_RED[2], 58))
-        self._fx.blit(red_wash, (0, 0))
-
-    def _draw_scene_fracture(self) -> None:
-        self._world.fill((0, 0, 0, 255))
-        self._draw_tiled_layer(self._world, "void", scale=16, alpha=155, seed_shift=40)
-
-        # chess-grid void
-        for x in range(0, SCREEN_WIDTH, 52):
-            pygame.draw.line(self._world, (18, 28, 48), (x, SCREEN_HEIGHT // 2), (x + 180, SCREEN_HEIGHT), 1)
-        for y in range(SCREEN_HEIGHT // 2, SCREEN_HEIGHT, 24):
-            pygame.draw.line(self._world, (16, 24, 42), (0, y), (SCREEN_WIDTH, y), 1)
-
-        self._draw_eye_glow(520, 328)
-        self._draw_eye_glow(760, 328)
-
-        if self._font_title and self._title_alpha > 0:
-            title = self._font_title.render("DOROTHY'S MIND GAMES", True, (214, 234, 255))
-            title.set_alpha(self._title_alpha)
-            self._fx.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 96))
-
-    # -------------------- Story/UI layer --------------------
-    def _draw_story_layer(self) -> None:
-        if not self._font_dialogue or not self._font_speaker:
-            return
-
-        bar_h = int(SCREEN_HEIGHT * 0.20)
-        bar = pygame.Surface((SCREEN_WIDTH, bar_h), pygame.SRCALPHA)
-        bar.fill((0, 0, 0, 150))
-        self._story.blit(bar, (0, SCREEN_HEIGHT - bar_h))
-
-        sp_col = NEON_CYAN if self._speaker != "GRANDMASTER" else (240, 240, 240)
-        sp = self._font_speaker.render(f"[{self._speaker}]", True, sp_col)
-        self._story.blit(sp, (36, SCREEN_HEIGHT - bar_h + 18))
-
-        txt = self._typewriter.text
-        line = self._font_dialogue.render(txt, True, TEXT_WHITE)
-        tx = (SCREEN_WIDTH - line.get_width()) // 2
-        ty = SCREEN_HEIGHT - bar_h + (bar_h - line.get_height()) // 2 + 16
-        self._story.blit(line, (tx, ty))
-
-    def _draw_hint(self) -> None:
-        if not self._font_hint:
-            return
-        hint = "PRESS ANY KEY" if self._can_continue else "ESC TO SKIP"
-        surf = self._font_hint.render(hint, True, (152, 166, 190))
-        self._story.blit(surf, (SCREEN_WIDTH - surf.get_width() - 24, 18))
-
-    # -------------------- Effects/helpers --------------------
-    def _draw_transition(self) -> None:
-        t = self._scene.transition_progress
-        if t <= 0:
-            return
-        ov = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        ov.fill((0, 0, 0, int(165 * t)))
-        self._fx.blit(ov, (0, 0))
-
-    def _draw_snow(self) -> None:
-        layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for p in self._snow:
-            layer.set_at((int(p.x), int(p.y)), (246, 248, 255, p.alpha))
-            if p.size > 1 and int(p.x) + 1 < SCREEN_WIDTH:
-                layer.set_at((int(p.x) + 1, int(p.y)), (246, 248, 255, p.alpha // 2))
-        self._fx.blit(layer, (0, 0))
-
-    def _draw_film_grain(self, strength: int) -> None:
-        grain = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for _ in range(3000):
-            x = self._rng.randint(0, SCREEN_WIDTH - 1)
-            y = self._rng.randint(0, SCREEN_HEIGHT - 1)
-            a = self._rng.randint(0, strength)
-            grain.set_at((x, y), (255, 255, 255, a))
-        self._fx.blit(grain, (0, 0))
-
-    def _draw_eye_glow(self, x: int, y: int) -> None:
-        glow = pygame.Surface((260, 260), pygame.SRCALPHA)
-        cx, cy = 130, 130
-        for r, a in [(98, 16), (74, 28), (52, 52), (32, 100), (16, 215)]:
-            pygame.draw.circle(glow, (NEON_CYAN[0], NEON_CYAN[1], NEON_CYAN[2], a), (cx, cy), r)
-        self._fx.blit(glow, (x - 130, y - 130))
-        pygame.draw.circle(self._fx, (214, 245, 255), (x, y), 6)
-
-    def _draw_board_lines(self, board_poly: list[tuple[int, int]]) -> None:
-        layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        x1, y1 = board_poly[0]
-        x2, y2 = board_poly[1]
-        x3, y3 = board_poly[2]
-        x4, y4 = board_poly[3]
-        for i in range(1, 8):
-            t = i / 8.0
-            ax = int(lerp(x1, x2, t))
-            ay = int(lerp(y1, y2, t))
-            bx = int(lerp(x4, x3, t))
-            by = int(lerp(y4, y3, t))
-            pygame.draw.line(layer, (82, 92, 112, 115), (ax, ay), (bx, by), 1)
-        for i in range(1, 5):
-            t = i / 5.0
-            ax = int(lerp(x1, x4, t))
-            ay = int(lerp(y1, y4, t))
-            bx = int(lerp(x2, x3, t))
-            by = int(lerp(y2, y3, t))
-            pygame.draw.line(layer, (82, 92, 112, 115), (ax, ay), (bx, by), 1)
-        self._fx.blit(layer, (0, 0))
-
-    def _slice_tilesheet(self, sheet: pygame.Surface, tile_size: int = 16) -> list[pygame.Surface]:
-        tiles: list[pygame.Surface] = []
-        sw, sh = sheet.get_size()
-        for y in range(0, sh, tile_size):
-            for x in range(0, sw, tile_size):
-                rect = pygame.Rect(x, y, tile_size, tile_size)
-                tiles.append(sheet.subsurface(rect).copy())
-        return tiles
-
-    def _draw_tiled_layer(
-        self,
-        target: pygame.Surface,
-        key: str,
-        *,
-        scale: int = 12,
-        alpha: int = 255,
-        seed_shift: int = 0,
-    ) -> None:
-        tiles = self._bg_tiles.get(key)
-        if not tiles:
-            return
-        tile_px = max(8, scale)
-        cols = SCREEN_WIDTH // tile_px + 2
-        rows = SCREEN_HEIGHT // tile_px + 2
-        for gy in range(rows):
-            for gx in range(cols):
-                # deterministic tile choice (no temporal flicker)
-                idx = (gx * 31 + gy * 17 + seed_shift * 13) % len(tiles)
-                src = tiles[idx]
-                tile = pygame.transform.scale(src, (tile_px, tile_px))
-                if alpha < 255:
-                    tile.set_alpha(alpha)
-                target.blit(tile, (gx * tile_px - tile_px // 2, gy * tile_px - tile_px // 2))
-
-    def _draw_textured_polygon(
-        self,
-        target: pygame.Surface,
-        key: str,
-        polygon: list[tuple[int, int]],
-        *,
-        scale: int = 12,
-        alpha: int = 255,
-        seed_shift: int = 0,
-    ) -> None:
-        # Fill polygon with pixellab tile texture.
-        mask = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.polygon(mask, (255, 255, 255, 255), polygon)
-        tex = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        self._draw_tiled_layer(tex, key, scale=scale, alpha=alpha, seed_shift=seed_shift)
-        tex.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        target.blit(tex, (0, 0))
-
-    def _draw_character(
-        self,
-        which: str,
-        direction: str,
-        pos: tuple[int, int],
-        *,
-        scale: float,
-        silhouette: bool = False,
-    ) -> None:
-        sprite_map = self._dorothy if which == "dorothy" else self._grandmaster
-        surf = sprite_map.get(direction)
-        if surf is None:
-            # fallback silhouette block if loading fails
-            x, y = pos
-            color = SHADOW if silhouette else (16, 18, 24)
-            pygame.draw.polygon(
-                self._world,
-                color,
-                [(x, y + 42), (x + 18, y - 38), (x + 46, y - 30), (x + 40, y + 42)],
-            )
-            return
-
-        w = int(surf.get_width() * scale)
-        h = int(surf.get_height() * scale)
-        sprite = pygame.transform.scale(surf, (w, h))
-        if silhouette:
-            sil = sprite.copy()
-            sil.fill((12, 12, 16, 240), special_flags=pygame.BLEND_RGBA_MULT)
-            sprite = sil
-        self._world.blit(sprite, pos)
-
-    # -------------------- Data setup --------------------
-    def _set_dialogue(self, speaker: str, text: str) -> None:
-        if speaker == self._speaker and text == self._line:
-            return
-        self._speaker = speaker
-        self._line = text
-        self._typewriter.set_text(text)
-
-    def _update_dialogue_timeline(self) -> None:
-        cues = DIALOGUE_CUES.get(self._scene.name, [])
-        if not cues:
-            self._set_dialogue("", "")
-            return
-        st = self._scene.scene_time
-        chosen: tuple[str, str] | None = None
-        for t, speaker, text in cues:
-            if st >= t:
-                chosen = (speaker, text)
-            else:
-                break
-        if chosen is None:
-            self._set_dialogue("", "")
-            return
-        self._set_dialogue(chosen[0], chosen[1])
-
-    def _init_snow(self) -> None:
-        self._snow.clear()
-        for _ in range(320):
-            self._snow.append(
-                Snow(
-                    x=random.uniform(0, SCREEN_WIDTH),
-                    y=random.uniform(-SCREEN_HEIGHT, SCREEN_HEIGHT),
-                    vy=random.uniform(24, 165),
-                    vx=random.uniform(-40, -8),
-                    alpha=random.randint(80, 220),
-                    size=random.choice([1, 1, 1, 2]),
-                )
-            )
-
-    def _update_snow(self, dt: float) -> None:
-        if self._scene.name != "exterior":
-            return
-        for p in self._snow:
-            p.y += p.vy * dt
-            p.x += p.vx * dt
-            if p.y > SCREEN_HEIGHT:
-                p.y = random.uniform(-32, -4)
-                p.x = random.uniform(0, SCREEN_WIDTH)
-
-    def _load_pixellab_assets(self) -> None:
-        self._dorothy.clear()
-        self._grandmaster.clear()
-        self._bg_sheets.clear()
-        self._bg_tiles.clear()
-
-        # Attempt network loading; if unavailable, scene still runs with fallback silhouettes.
-        for key, url in DOROTHY_URLS.items():
-            img = load_image_from_url(url)
-            if img is not None:
-                self._dorothy[key] = img
-
-        for key, url in GRANDMASTER_URLS.items():
-            img = load_image_from_url(url)
-            if img is not None:
-                self._grandmaster[key] = img
-
-        bg_sources = {
-            "exterior": EXTERIOR_TILESET_URL,
-            "stage": STAGE_TILESET_URL,
-            "void": VOID_TILESET_URL,
-        }
-        for key, url in bg_sources.items():
-            img = load_image_from_url(url)
-            if img is not None:
-                self._bg_sheets[key] = img
-                self._bg_tiles[key] = self._slice_tilesheet(img, tile_size=16)
-
-        self._assets_ready = bool(self._dorothy) and bool(self._grandmaster)
-
-    def _go_to_menu(self) -> None:
-        from src.states.main_menu_state import MainMenuState
-
-        self._sm.switch(MainMenuState(self._sm))
-
+"""
+PixelLab-powered intro cinematic for Dorothy's Mind Games.
+
+This version uses generated PixelLab character sprites and composes them
+into a fully scripted four-scene intro with strict ordering, typewriter text,
+and atmospheric transitions.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING
+import functools
+import hashlib
+import math
+import urllib.request
+
+import numpy as np
+import pygame
+
+from src.core.constants import COLOR_BG, SCREEN_HEIGHT, SCREEN_WIDTH
+
+if TYPE_CHECKING:
+    from src.core.state_manager import StateManager
+
+
+# -------------------- Visual palette --------------------
+MIDNIGHT_TOP = (6, 12, 30)
+MIDNIGHT_BOTTOM = (18, 30, 62)
+STAGE_DARK = (10, 10, 16)
+NEON_CYAN = (86, 224, 255)
+BLOOD_RED = (186, 30, 56)
+WINDOW_YELLOW = (236, 206, 115)
+TEXT_WHITE = (238, 244, 255)
+OFF_WHITE = (236, 240, 248)
+SHADOW = (12, 12, 16)
+
+
+# -------------------- Narrative script --------------------
+# (time_from_scene_start, speaker, line)
+DIALOGUE_CUES: dict[str, list[tuple[float, str, str]]] = {
+    "exterior": [
+        (0.2, "NARRATOR", "On this night, the impossible happened. The Titan fell."),
+    ],
+    "defeat": [
+        (1.8, "SYSTEM", "Queen to H8. Checkmate."),
+        (3.4, "NARRATOR", "Silence. Then the crowd erupted like thunder."),
+        (5.2, "NARRATOR", "The Grandmaster laughed—proud, relieved, and free."),
+    ],
+    "warning": [
+        (0.8, "GRANDMASTER", "...Finally. I am free of it."),
+        (2.3, "DOROTHY", "Free?"),
+        (3.3, "GRANDMASTER", "They cheer for you now, little genius. They see the crown."),
+        (5.2, "GRANDMASTER", "They do not see the weight."),
+        (6.3, "GRANDMASTER", "It is easy to climb. It is terrifying to stay at the summit."),
+    ],
+    "fracture": [
+        (1.0, "GRANDMASTER", "Now you must face the burden of being No. 1."),
+        (3.3, "VOICE", "Try to keep your Sanity. Only your moves will prevail now."),
+    ],
+}
+
+
+# -------------------- PixelLab sprite URLs --------------------
+# Pulled from the generated character outputs in this session.
+DOROTHY_URLS: dict[str, str] = {
+    "west": "https://backblaze.pixellab.ai/file/pixellab-characters/4540cfab-6348-4db3-a492-6c55e0b1c37e/64c63f37-31fa-4af3-b9c2-80091ab2fc82/rotations/west.png?t=1771147884581",
+    "east": "https://backblaze.pixellab.ai/file/pixellab-characters/4540cfab-6348-4db3-a492-6c55e0b1c37e/64c63f37-31fa-4af3-b9c2-80091ab2fc82/rotations/east.png?t=1771147884581",
+    "north-west": "https://backblaze.pixellab.ai/file/pixellab-characters/4540cfab-6348-4db3-a492-6c55e0b1c37e/64c63f37-31fa-4af3-b9c2-80091ab2fc82/rotations/north-west.png?t=1771147884581",
+    "north-east": "https://backblaze.pixellab.ai/file/pixellab-characters/4540cfab-6348-4db3-a492-6c55e0b1c37e/64c63f37-31fa-4af3-b9c2-80091ab2fc82/rotations/north-east.png?t=1771147884581",
+}
+
+GRANDMASTER_URLS: dict[str, str] = {
+    "west": "https://backblaze.pixellab.ai/file/pixellab-characters/4540cfab-6348-4db3-a492-6c55e0b1c37e/9b7d7e79-37f0-4177-9946-f8f1ea9fba40/rotations/west.png?t=1771147884628",
+    "east": "https://backblaze.pixellab.ai/file/pixellab-characters/4540cfab-6348-4db3-a492-6c55e0b1c37e/9b7d7e79-37f0-4177-9946-f8f1ea9fba40/rotations/east.png?t=1771147884628",
+    "north-west": "https://backblaze.pixellab.ai/file/pixellab-characters/4540cfab-6348-4db3-a492-6c55e0b1c37e/9b7d7e79-37f0-4177-9946-f8f1ea9fba40/rotations/north-west.png?t=1771147884628",
+    "north-east": "https://backblaze.pixellab.ai/file/pixellab-characters/4540cfab-6348-4db3-a492-6c55e0b1c37e/9b7d7e79-37f0-4177-9946-f8f1ea9fba40/rotations/north-east.png?t=1771147884628",
+}
+
+# PixelLab-generated background tilesets (4x4 sheet, 16x16 each tile)
+EXTERIOR_TILESET_URL = "https://api.pixellab.ai/mcp/tilesets/09a6e07d-b565-40fd-aa05-a0e6466a5467/image"
+STAGE_TILESET_URL = "https://api.pixellab.ai/mcp/tilesets/5681e9c1-0d4f-45f8-aaac-eba34b5cbaac/image"
+VOID_TILESET_URL = "https://api.pixellab.ai/mcp/tilesets/d20a6544-e213-4640-9be7-2994da8733d5/image"
+
+
+# -------------------- Helpers --------------------
+# These run hundreds of times per frame from render code, so the
+# Python-call overhead matters more than the arithmetic: comparisons
+# are inlined instead of chaining through clamp01, and lerp defers to
+# pygame's C implementation (which clamps, matching the old helper).
+def clamp01(v: float) -> float:
+    return 0.0 if v < 0.0 else 1.0 if v > 1.0 else v
+
+
+def ease(t: float) -> float:
+    t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+    return t * t * (3.0 - 2.0 * t)
+
+
+try:
+    lerp = pygame.math.lerp  # C-level, clamps t to [0, 1] by default
+except AttributeError:  # pre-2.1.3 pygame
+    def lerp(a: float, b: float, t: float) -> float:
+        t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+        return a + (b - a) * t
+
+
+def lerp_color(a: tuple[int, int, int], b: tuple[int, int, int], t: float) -> tuple[int, int, int]:
+    t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+    return (
+        int(a[0] + (b[0] - a[0]) * t),
+        int(a[1] + (b[1] - a[1]) * t),
+        int(a[2] + (b[2] - a[2]) * t),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def build_gradient(height: int, top: tuple[int, int, int], bottom: tuple[int, int, int]) -> pygame.Surface:
+    # Cached per (height, top, bottom): the gradients are static, so the
+    # construction runs once and every later call is a dict hit.
+    # Callers only blit the returned surface, never draw into it.
+    #
+    # Built as one NumPy broadcast instead of a per-row draw.line loop:
+    # interpolate a (height, 1, 3) colour column, then let blit_array
+    # expand it across the width at C speed.
+    ts = np.linspace(0.0, 1.0, max(height, 2), dtype=np.float32)[:height, None]
+    col = (
+        np.asarray(top, dtype=np.float32) * (1.0 - ts)
+        + np.asarray(bottom, dtype=np.float32) * ts
+    ).astype(np.uint8)
+    surf = pygame.Surface((SCREEN_WIDTH, height), pygame.SRCALPHA)
+    surf.fill((0, 0, 0, 255))  # opaque alpha; blit_array only writes RGB
+    # surfarray is (width, height, 3): broadcast the column across x.
+    pygame.surfarray.blit_array(
+        surf, np.broadcast_to(col[None, :, :], (SCREEN_WIDTH, height, 3))
+    )
+    return surf
+
+
+def load_pixel_font(size: int) -> pygame.font.Font:
+    candidates = [
+        Path(r"D:\Nick-Works\dorothy's_MindGames\src\assets\fonts\PressStart2P-Regular.ttf"),
+        Path(r"D:\Nick-Works\dorothy's_MindGames\assets\fonts\PressStart2P-Regular.ttf"),
+        Path(r"D:\Nick-Works\dorothy's_MindGames\src\assets\fonts\Silver.ttf"),
+        Path(r"D:\Nick-Works\dorothy's_MindGames\assets\fonts\Silver.ttf"),
+    ]
+    for path in candidates:
+        if path.exists():
+            return pygame.font.Font(str(path), size)
+    return pygame.font.SysFont("consolas", size, bold=False)
+
+
+# Downloaded assets are cached on disk keyed by URL hash, so repeat
+# runs load locally instead of re-fetching everything.
+_ASSET_CACHE_DIR = Path.home() / ".cache" / "dorothy_mindgames"
+
+
+def fetch_url_bytes(url: str, timeout: float = 8.0) -> bytes | None:
+    """Download raw bytes, via the on-disk cache; worker-thread safe."""
+    cache_file = _ASSET_CACHE_DIR / hashlib.sha1(url.encode()).hexdigest()
+    try:
+        return cache_file.read_bytes()
+    except OSError:
+        pass
+    try:
+        req = urllib.request.Request(
+            url,
+            headers={
+                "User-Agent": "DorothyMindGames/1.0",
+                "Accept": "image/png,image/*;q=0.8,*/*;q=0.5",
+            },
+        )
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            data = response.read()
+    except Exception:
+        return None
+    try:
+        # Write-then-rename so a crash mid-write never leaves a
+        # truncated cache entry behind.
+        _ASSET_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(cache_file)
+    except OSError:
+        pass  # caching is best-effort; the download still succeeded
+    return data
+
+
+def load_image_from_url(url: str, timeout: float = 8.0) -> pygame.Surface | None:
+    data = fetch_url_bytes(url, timeout)
+    if data is None:
+        return None
+    try:
+        return pygame.image.load(BytesIO(data)).convert_alpha()
+    except Exception:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class Scene:
+    name: str
+    duration: float
+    transition: float
+
+
+class SceneManager:
+    """Strictly sequential scene controller."""
+
+    # Read every frame from update/draw paths; slots keep the
+    # attribute loads off the instance-dict lookup path.
+    __slots__ = ("_timeline", "_index", "_scene_t", "_global_t")
+
+    def __init__(self) -> None:
+        self._timeline = [
+            Scene("exterior", 9.0, 1.2),
+            Scene("defeat", 8.5, 1.1),
+            Scene("warning", 9.0, 1.4),
+            Scene("fracture", 9.5, 0.0),
+        ]
+        self._index = 0
+        self._scene_t = 0.0
+        self._global_t = 0.0
+
+    @property
+    def name(self) -> str:
+        return self._timeline[self._index].name
+
+    @property
+    def scene_time(self) -> float:
+        return self._scene_t
+
+    @property
+    def scene_progress(self) -> float:
+        d = self._timeline[self._index].duration
+        if d <= 0:
+            return 1.0
+        return clamp01(self._scene_t / d)
+
+    @property
+    def transition_progress(self) -> float:
+        scene = self._timeline[self._index]
+        if scene.transition <= 0:
+            return 0.0
+        start = max(0.0, scene.duration - scene.transition)
+        if self._scene_t <= start:
+            return 0.0
+        return clamp01((self._scene_t - start) / scene.transition)
+
+    @property
+    def global_time(self) -> float:
+        return self._global_t
+
+    def update(self, dt: float) -> bool:
+        self._global_t += dt
+        self._scene_t += dt
+        scene = self._timeline[self._index]
+        if self._scene_t < scene.duration:
+            return False
+        if self._index < len(self._timeline) - 1:
+            self._index += 1
+            self._scene_t = 0.0
+            return True
+        return False
+
+
+class Typewriter:
+    __slots__ = ("_cps", "_text", "_elapsed")
+
+    def __init__(self, cps: float = 22.0) -> None:
+        self._cps = cps
+        self._text = ""
+        self._elapsed = 0.0
+
+    def set_text(self, text: str) -> None:
+        if text != self._text:
+            self._text = text
+            self._elapsed = 0.0
+
+    def update(self, dt: float) -> None:
+        self._elapsed += dt
+
+    @property
+    def visible_count(self) -> int:
+        n = int(self._elapsed * self._cps)
+        return max(0, min(n, len(self._text)))
+
+    @property
+    def text(self) -> str:
+        return self._text[:self.visible_count]
+
+
+class IntroState:
+    """PixelLab-quality intro state."""
+
+    is_opaque = True
+
+    def __init__(self, state_manager: "StateManager") -> None:
+        self._sm = state_manager
+        self._scene = SceneManager()
+        self._typewriter = Typewriter(22.0)
+        self._speaker = "NARRATOR"
+        self._line = ""
+        self._title_alpha = 0
+        self._can_continue = False
+        self._clack_flash = 0.0
+        # Cue cursor: dialogue cues are sorted per scene, so per frame
+        # we only compare scene_time against the next unfired cue.
+        self._cue_scene = ""
+        self._cue_idx = 0
+
+        # Rendered-text caches: the typewriter only reveals a new
+        # character ~22x/second, so re-rendering at 60 FPS wasted most
+        # font.render calls; speakers recur, so their labels are kept.
+        self._tw_key: tuple[int, str] = (-1, "")
+        self._tw_surf: pygame.Surface | None = None
+        self._speaker_surfs: dict[str, pygame.Surface] = {}
+        # Static story-layer furniture, rendered once in enter(): the
+        # dialogue bar and the two possible hint strings.
+        self._bar_surf: pygame.Surface | None = None
+        self._hint_skip_surf: pygame.Surface | None = None
+        self._hint_continue_surf: pygame.Surface | None = None
+
+        # layers
+        self._world = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._fx = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._story = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)  # dedicated story layer
+
+        # Single batched RNG for all per-frame effects (grain, glitch,
+        # snow) — one C call per effect instead of per-sample calls.
+        self._np_rng = np.random.default_rng(1337)
+
+        # Snowfall as structure-of-arrays: one numpy array per field
+        # instead of 320 dataclass instances, so update and render are
+        # whole-array operations (allocated in _init_snow).
+        self._snow_x = np.empty(0, dtype=np.float32)
+        self._snow_y = np.empty(0, dtype=np.float32)
+        self._snow_vx = np.empty(0, dtype=np.float32)
+        self._snow_vy = np.empty(0, dtype=np.float32)
+        self._snow_alpha = np.empty(0, dtype=np.uint8)
+        self._snow_size = np.empty(0, dtype=np.uint8)
+        self._snow_buf = np.zeros((SCREEN_HEIGHT, SCREEN_WIDTH, 4), dtype=np.uint8)
+        self._snow_layer = pygame.image.frombuffer(
+            self._snow_buf, (SCREEN_WIDTH, SCREEN_HEIGHT), "RGBA"
+        )
+        self._snow_prev: tuple[np.ndarray, np.ndarray] | None = None
+
+        # Film-grain scratch: a persistent RGBA pixel buffer shared with
+        # a frombuffer surface, so each frame only writes the ~3000
+        # sampled speckles (and clears the previous frame's) instead of
+        # allocating a full-screen surface and calling set_at per pixel.
+        self._grain_buf = np.zeros((SCREEN_HEIGHT, SCREEN_WIDTH, 4), dtype=np.uint8)
+        self._grain_surf = pygame.image.frombuffer(
+            self._grain_buf, (SCREEN_WIDTH, SCREEN_HEIGHT), "RGBA"
+        )
+        self._grain_prev: tuple[np.ndarray, np.ndarray] | None = None
+
+        self._font_dialogue: pygame.font.Font | None = None
+        self._font_speaker: pygame.font.Font | None = None
+        self._font_title: pygame.font.Font | None = None
+        self._font_hint: pygame.font.Font | None = None
+
+        # PixelLab sprites
+        self._dorothy: dict[str, pygame.Surface] = {}
+        self._grandmaster: dict[str, pygame.Surface] = {}
+        self._bg_sheets: dict[str, pygame.Surface] = {}
+        self._bg_tiles: dict[str, list[pygame.Surface]] = {}
+        # Tiles pre-scaled (and alpha-set) per (key, tile_px, alpha) so
+        # the tiled-layer loop never calls transform.scale per cell.
+        self._scaled_tiles: dict[tuple[str, int, int], list[pygame.Surface]] = {}
+        # Downloads run on worker threads (bytes only — Surface work
+        # must stay on the main thread); update() polls the futures and
+        # decodes results as they arrive, so enter() never blocks and
+        # the scenes play with fallback silhouettes until sprites land.
+        self._asset_pool: ThreadPoolExecutor | None = None
+        self._asset_futures: dict[tuple[str, str], Future[bytes | None]] = {}
+        # Character sprites pre-scaled (and silhouette-tinted) per
+        # (which, direction, scale, silhouette) — all constant within a
+        # scene, so the per-frame resample + tint pass runs only once.
+        self._sprite_cache: dict[tuple[str, str, float, bool], pygame.Surface] = {}
+        # Static light effects baked on first use — identical pixels
+        # every frame, so rebuilding them per frame was pure waste.
+        self._eye_glow_surf: pygame.Surface | None = None
+        self._spot_exterior: pygame.Surface | None = None
+        self._spot_defeat: pygame.Surface | None = None
+        # Line clusters baked into strips: the ten window rows and the
+        # board grid are static, so each becomes one blit per frame.
+        self._window_glow_strip: pygame.Surface | None = None
+        self._window_lines_strip: pygame.Surface | None = None
+        self._board_lines_surfs: dict[tuple[tuple[int, int], ...], pygame.Surface] = {}
+        # Bbox-local alpha masks per polygon — the scene polygons are
+        # static, so each mask is rasterised exactly once.
+        self._poly_masks: dict[tuple[tuple[int, int], ...], pygame.Surface] = {}
+        # Deterministic tile-index grids per (seed_shift, tile_px,
+        # n_tiles) — the hash/modulo pattern never changes, so it is
+        # computed once as a numpy broadcast and iterated as lists.
+        self._tile_grids: dict[tuple[int, int, int], list[list[int]]] = {}
+        # Full-screen tiled layers composited once per scene layer; the
+        # parameters are fixed, so each frame blits ONE cached surface
+        # instead of re-tiling hundreds of cells.
+        self._cached_bg: dict[str, pygame.Surface] = {}
+        self._assets_ready = False
+
+    def enter(self) -> None:
+        self._font_dialogue = load_pixel_font(26)
+        self._font_speaker = load_pixel_font(22)
+        self._font_title = load_pixel_font(72)
+        self._font_hint = load_pixel_font(16)
+        bar_h = int(SCREEN_HEIGHT * 0.20)
+        self._bar_surf = pygame.Surface((SCREEN_WIDTH, bar_h), pygame.SRCALPHA)
+        self._bar_surf.fill((0, 0, 0, 150))
+        self._hint_skip_surf = self._font_hint.render("ESC TO SKIP", True, (152, 166, 190))
+        self._hint_continue_surf = self._font_hint.render("PRESS ANY KEY", True, (152, 166, 190))
+        self._set_dialogue("NARRATOR", "On this night, the impossible happened. The Titan fell.")
+        self._init_snow()
+        self._load_pixellab_assets()
+
+    def exit(self) -> None:
+        if self._asset_pool is not None:
+            self._asset_pool.shutdown(wait=False, cancel_futures=True)
+            self._asset_pool = None
+            self._asset_futures.clear()
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_ESCAPE:
+            self._go_to_menu()
+            return
+        if self._can_continue:
+            self._go_to_menu()
+
+    def update(self, dt: float) -> None:
+        if self._asset_futures:
+            self._poll_asset_futures()
+        changed = self._scene.update(dt)
+        self._typewriter.update(dt)
+        self._update_snow(dt)
+        self._clack_flash = max(0.0, self._clack_flash - dt)
+
+        if changed:
+            self._set_dialogue("", "")
+
+        self._update_dialogue_timeline()
+
+        if self._scene.name == "defeat" and 2.0 < self._scene.scene_time < 2.2 and self._clack_flash <= 0:
+            self._clack_flash = 0.22
+
+        if self._scene.name == "fracture":
+            if self._scene.scene_progress > 0.35:
+                self._title_alpha = int(255 * ease((self._scene.scene_progress - 0.35) / 0.5))
+            if self._scene.scene_progress > 0.88:
+                self._can_continue = True
+
+    def draw(self, surface: pygame.Surface) -> None:
+        # _world is not cleared: every scene starts by painting it edge
+        # to edge (gradient or opaque fill), so zeroing its ~3.7 MB of
+        # pixels first was pure extra memory traffic.  Only the overlay
+        # layers, which stay mostly transparent, need the clear.
+        self._fx.fill((0, 0, 0, 0))
+        self._story.fill((0, 0, 0, 0))
+
+        if self._scene.name == "exterior":
+            self._draw_scene_exterior()
+        elif self._scene.name == "defeat":
+            self._draw_scene_defeat()
+        elif self._scene.name == "warning":
+            self._draw_scene_warning()
+        else:
+            self._draw_scene_fracture()
+
+        self._draw_transition()
+        self._draw_story_layer()
+        self._draw_hint()
+
+        surface.fill(COLOR_BG)
+        surface.blit(self._world, (0, 0))
+        surface.blit(self._fx, (0, 0))
+        surface.blit(self._story, (0, 0))
+
+    # -------------------- Scene render --------------------
+    def _draw_scene_exterior(self) -> None:
+        self._world.blit(build_gradient(SCREEN_HEIGHT, MIDNIGHT_TOP, MIDNIGHT_BOTTOM), (0, 0))
+        # Base and depth layers from PixelLab exterior tiles
+        self._blit_cached_layer(self._world, "exterior_base", "exterior", scale=20, alpha=150, seed_shift=1)
+        self._blit_cached_layer(self._fx, "exterior_depth", "exterior", scale=14, alpha=70, seed_shift=2)
+        self._draw_film_grain(18)
+
+        # Hall silhouette now textured with PixelLab exterior tiles
+        hall_main = [(180, 590), (320, 190), (980, 190), (1100, 590)]
+        hall_inner = [(260, 570), (395, 280), (900, 280), (1010, 570)]
+        roof = [(248, 252), (640, 110), (1032, 252)]
+        tower_l = [(310, 255), (372, 255), (360, 122), (322, 122)]
+        tower_r = [(910, 255), (972, 255), (958, 136), (920, 136)]
+        self._draw_textured_polygon(self._world, "exterior", hall_main, scale=14, alpha=220, seed_shift=3)
+        self._draw_textured_polygon(self._world, "exterior", hall_inner, scale=12, alpha=210, seed_shift=4)
+        self._draw_textured_polygon(self._world, "exterior", roof, scale=12, alpha=225, seed_shift=5)
+        self._draw_textured_polygon(self._world, "exterior", tower_l, scale=10, alpha=225, seed_shift=6)
+        self._draw_textured_polygon(self._world, "exterior", tower_r, scale=10, alpha=225, seed_shift=7)
+
+        # crisp silhouette and readable sign so hall is unmistakable
+        pygame.draw.polygon(self._fx, (4, 8, 16, 210), hall_main, 3)
+        sign_rect = pygame.Rect(470, 360, 340, 72)
+        pygame.draw.rect(self._fx, (222, 232, 246, 235), sign_rect, border_radius=4)
+        pygame.draw.rect(self._fx, (28, 40, 62, 255), sign_rect, 2, border_radius=4)
+        if self._font_hint:
+            s1 = self._font_hint.render("WORLD CHESS", True, (24, 34, 58))
+            s2 = self._font_hint.render("CHAMPIONSHIP", True, (24, 34, 58))
+            self._fx.blit(s1, (sign_rect.centerx - s1.get_width() // 2, sign_rect.y + 14))
+            self._fx.blit(s2, (sign_rect.centerx - s2.get_width() // 2, sign_rect.y + 38))
+
+        # Window slits with glow — baked into two strips (glow rows
+        # for fx, crisp rows for world) instead of per-line surfaces.
+        if self._window_glow_strip is None:
+            glow = pygame.Surface((282, 196), pygame.SRCALPHA)
+            lines = pygame.Surface((282, 196), pygame.SRCALPHA)
+            for i in range(10):
+                y = 6 + i * 20
+                pygame.draw.line(glow, (255, 220, 132, 62), (2, y), (278, y), 4)
+                pygame.draw.line(lines, WINDOW_YELLOW, (6, y), (274, y), 2)
+            self._window_glow_strip = glow
+            self._window_lines_strip = lines
+        self._world.blit(self._window_lines_strip, (500, 300))
+        self._fx.blit(self._window_glow_strip, (500, 300))
+
+        # Ground
+        pygame.draw.polygon(self._world, (10, 14, 24), [(0, 558), (1280, 558), (1280, 720), (0, 720)])
+        pygame.draw.polygon(self._world, (14, 18, 28), [(420, 558), (860, 558), (770, 720), (510, 720)])
+
+        # Spotlights (baked once)
+        if self._spot_exterior is None:
+            spot = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            pygame.draw.polygon(spot, (120, 220, 255, 36), [(130, 545), (352, 196), (500, 196)])
+            pygame.draw.polygon(spot, (120, 220, 255, 36), [(1150, 545), (780, 196), (928, 196)])
+            self._spot_exterior = spot
+        self._fx.blit(self._spot_exterior, (0, 0))
+
+        self._draw_snow()
+
+    def _draw_scene_defeat(self) -> None:
+        self._world.blit(build_gradient(SCREEN_HEIGHT, (8, 10, 18), (24, 18, 28)), (0, 0))
+        self._blit_cached_layer(self._world, "defeat_stage", "stage", scale=16, alpha=170, seed_shift=20)
+        self._draw_film_grain(12)
+
+        # Dark stage + spotlight
+        pygame.draw.polygon(self._world, (20, 14, 20), [(220, 548), (1060, 548), (1240, 720), (40, 720)])
+        if self._spot_defeat is None:
+            spot = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            pygame.draw.polygon(spot, (255, 255, 255, 68), [(640, 28), (484, 542), (796, 542)])
+            pygame.draw.polygon(spot, (255, 255, 255, 32), [(640, 28), (430, 640), (850, 640)])
+            self._spot_defeat = spot
+        self._fx.blit(self._spot_defeat, (0, 0))
+
+        # Table / board
+        table_poly = [(494, 522), (786, 522), (740, 616), (540, 616)]
+        board_poly = [(556, 506), (724, 506), (697, 564), (583, 564)]
+        self._draw_textured_polygon(self._world, "stage", table_poly, scale=10, alpha=230, seed_shift=21)
+        self._draw_textured_polygon(self._world, "stage", board_poly, scale=8, alpha=235, seed_shift=22)
+        self._draw_board_lines(board_poly)
+
+        # Handshake action
+        shake_y = int(470 + math.sin(self._scene.scene_time * 2.4) * 1.8)
+        self._draw_character("dorothy", "east", (470, 476), scale=4.5)
+        laugh_shake = int(math.sin(self._scene.scene_time * 21.0) * 4) if self._scene.scene_time > 2.1 else 0
+        self._draw_character("grandmaster", "west", (760, 458 + laugh_shake), scale=4.8)
+        pygame.draw.line(self._fx, OFF_WHITE, (565, shake_y), (706, shake_y - 8), 3)
+
+        # Piece move + clack flash
+        piece_t = ease(min(1.0, self._scene.scene_time / 2.0))
+        px = int(lerp(592, 664, piece_t))
+        pygame.draw.polygon(self._fx, (220, 232, 250, 220), [(px, 530), (px + 8, 517), (px + 16, 530), (px + 8, 542)])
+
+        if self._clack_flash > 0:
+            flash = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            flash.fill((255, 255, 255, int(125 * (self._clack_flash / 0.22))))
+            self._fx.blit(flash, (0, 0))
+
+    def _draw_scene_warning(self) -> None:
+        self._world.blit(build_gradient(SCREEN_HEIGHT, (30, 8, 18), (70, 10, 22)), (0, 0))
+        self._blit_cached_layer(self._world, "warning_void", "void", scale=14, alpha=150, seed_shift=30)
+        self._blit_cached_layer(self._fx, "warning_stage", "stage", scale=12, alpha=80, seed_shift=31)
+        self._draw_film_grain(20)
+
+        # fracture shards
+        pygame.draw.polygon(self._world, (92, 20, 34), [(0, 186), (420, 142), (365, 236), (0, 274)])
+        pygame.draw.polygon(self._world, (92, 20, 34), [(1280, 144), (878, 196), (912, 284), (1280, 250)])
+        pygame.draw.polygon(self._world, (92, 20, 34), [(250, 490), (640, 434), (716, 562), (290, 606)])
+
+        # frozen stance
+        self._draw_character("dorothy", "east", (490, 486), scale=4.5)
+        self._draw_character("grandmaster", "west", (760, 458), scale=4.8, silhouette=True)
+
+        # glitch row offset (pulsed, not constant)
+        if int(self._scene.global_time * 5) % 3 == 0:
+            # In-place row shift through a surfarray view: one batched
+            # RNG draw plus a vectorized gather replaces the full-surface
+            # copy and ~180 per-row blits.  The world is fully opaque
+            # here (gradient underneath), so shifting RGB alone is
+            # exact; rows wrap around instead of leaving blank edges.
+            row_h = 4
+            nrows = -(-SCREEN_HEIGHT // row_h)
+            dx = np.where(
+                self._np_rng.random(nrows) < 0.28,
+                self._np_rng.integers(-18, 19, nrows),
+                0,
+            )
+            dx_per_y = np.repeat(dx, row_h)[:SCREEN_HEIGHT]
+            arr = pygame.surfarray.pixels3d(self._world)
+            src_x = (np.arange(SCREEN_WIDTH)[:, None] - dx_per_y[None, :]) % SCREEN_WIDTH
+            arr[:, :, :] = arr[src_x, np.arange(SCREEN_HEIGHT)[None, :], :]
+            del arr  # release the surface lock
+
+        red_wash = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        red_wash.fill((BLOOD_RED[0], BLOOD_RED[1], BLOOD_RED[2], 58))
+        self._fx.blit(red_wash, (0, 0))
+
+    def _draw_scene_fracture(self) -> None:
+        self._world.fill((0, 0, 0, 255))
+        self._blit_cached_layer(self._world, "fracture_void", "void", scale=16, alpha=155, seed_shift=40)
+
+        # chess-grid void
+        for x in range(0, SCREEN_WIDTH, 52):
+            pygame.draw.line(self._world, (18, 28, 48), (x, SCREEN_HEIGHT // 2), (x + 180, SCREEN_HEIGHT), 1)
+        for y in range(SCREEN_HEIGHT // 2, SCREEN_HEIGHT, 24):
+            pygame.draw.line(self._world, (16, 24, 42), (0, y), (SCREEN_WIDTH, y), 1)
+
+        self._draw_eye_glow(520, 328)
+        self._draw_eye_glow(760, 328)
+
+        if self._font_title and self._title_alpha > 0:
+            title = self._font_title.render("DOROTHY'S MIND GAMES", True, (214, 234, 255))
+            title.set_alpha(self._title_alpha)
+            self._fx.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 96))
+
+    # -------------------- Story/UI layer --------------------
+    def _draw_story_layer(self) -> None:
+        if not self._font_dialogue or not self._font_speaker:
+            return
+
+        bar_h = int(SCREEN_HEIGHT * 0.20)
+        if self._bar_surf is not None:
+            self._story.blit(self._bar_surf, (0, SCREEN_HEIGHT - bar_h))
+
+        sp = self._speaker_surfs.get(self._speaker)
+        if sp is None:
+            sp_col = NEON_CYAN if self._speaker != "GRANDMASTER" else (240, 240, 240)
+            sp = self._font_speaker.render(f"[{self._speaker}]", True, sp_col)
+            self._speaker_surfs[self._speaker] = sp
+        self._story.blit(sp, (36, SCREEN_HEIGHT - bar_h + 18))
+
+        tw_key = (self._typewriter.visible_count, self._line)
+        line = self._tw_surf
+        if line is None or tw_key != self._tw_key:
+            line = self._font_dialogue.render(self._line[:tw_key[0]], True, TEXT_WHITE)
+            self._tw_key = tw_key
+            self._tw_surf = line
+        tx = (SCREEN_WIDTH - line.get_width()) // 2
+        ty = SCREEN_HEIGHT - bar_h + (bar_h - line.get_height()) // 2 + 16
+        self._story.blit(line, (tx, ty))
+
+    def _draw_hint(self) -> None:
+        surf = self._hint_continue_surf if self._can_continue else self._hint_skip_surf
+        if surf is None:
+            return
+        self._story.blit(surf, (SCREEN_WIDTH - surf.get_width() - 24, 18))
+
+    # -------------------- Effects/helpers --------------------
+    def _draw_transition(self) -> None:
+        t = self._scene.transition_progress
+        if t <= 0:
+            return
+        ov = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        ov.fill((0, 0, 0, int(165 * t)))
+        self._fx.blit(ov, (0, 0))
+
+    def _draw_snow(self) -> None:
+        # Write all flakes into the persistent RGBA buffer with two
+        # fancy-index stores (big flakes get a dimmer second pixel),
+        # clearing only the previous frame's pixels first.
+        if self._snow_prev is not None:
+            py, px = self._snow_prev
+            self._snow_buf[py, px] = 0
+        ix = self._snow_x.astype(np.int32)
+        iy = self._snow_y.astype(np.int32)
+        # set_at silently clipped off-screen flakes; mask them here.
+        on = (ix >= 0) & (ix < SCREEN_WIDTH) & (iy >= 0) & (iy < SCREEN_HEIGHT)
+        ix, iy = ix[on], iy[on]
+        alpha = self._snow_alpha[on]
+        self._snow_buf[iy, ix, :3] = 246, 248, 255
+        self._snow_buf[iy, ix, 3] = alpha
+        wide = (self._snow_size[on] > 1) & (ix + 1 < SCREEN_WIDTH)
+        ix2, iy2 = ix[wide] + 1, iy[wide]
+        self._snow_buf[iy2, ix2, :3] = 246, 248, 255
+        self._snow_buf[iy2, ix2, 3] = alpha[wide] // 2
+        self._snow_prev = (np.concatenate((iy, iy2)), np.concatenate((ix, ix2)))
+        self._fx.blit(self._snow_layer, (0, 0))
+
+    def _draw_film_grain(self, strength: int) -> None:
+        # One batched RNG draw and two fancy-index writes into the
+        # persistent buffer replace 3000 locked set_at calls per frame.
+        if self._grain_prev is not None:
+            py, px = self._grain_prev
+            self._grain_buf[py, px] = 0
+        xs = self._np_rng.integers(0, SCREEN_WIDTH, 3000)
+        ys = self._np_rng.integers(0, SCREEN_HEIGHT, 3000)
+        alphas = self._np_rng.integers(0, strength + 1, 3000, dtype=np.uint8)
+        self._grain_buf[ys, xs, :3] = 255
+        self._grain_buf[ys, xs, 3] = alphas
+        self._grain_prev = (ys, xs)
+        self._fx.blit(self._grain_surf, (0, 0))
+
+    def _draw_eye_glow(self, x: int, y: int) -> None:
+        if self._eye_glow_surf is None:
+            glow = pygame.Surface((260, 260), pygame.SRCALPHA)
+            cx, cy = 130, 130
+            for r, a in [(98, 16), (74, 28), (52, 52), (32, 100), (16, 215)]:
+                pygame.draw.circle(glow, (NEON_CYAN[0], NEON_CYAN[1], NEON_CYAN[2], a), (cx, cy), r)
+            self._eye_glow_surf = glow
+        self._fx.blit(self._eye_glow_surf, (x - 130, y - 130))
+        pygame.draw.circle(self._fx, (214, 245, 255), (x, y), 6)
+
+    def _draw_board_lines(self, board_poly: list[tuple[int, int]]) -> None:
+        key = tuple(board_poly)
+        layer = self._board_lines_surfs.get(key)
+        if layer is not None:
+            self._fx.blit(layer, (0, 0))
+            return
+        layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        x1, y1 = board_poly[0]
+        x2, y2 = board_poly[1]
+        x3, y3 = board_poly[2]
+        x4, y4 = board_poly[3]
+        for i in range(1, 8):
+            t = i / 8.0
+            ax = int(lerp(x1, x2, t))
+            ay = int(lerp(y1, y2, t))
+            bx = int(lerp(x4, x3, t))
+            by = int(lerp(y4, y3, t))
+            pygame.draw.line(layer, (82, 92, 112, 115), (ax, ay), (bx, by), 1)
+        for i in range(1, 5):
+            t = i / 5.0
+            ax = int(lerp(x1, x4, t))
+            ay = int(lerp(y1, y4, t))
+            bx = int(lerp(x2, x3, t))
+            by = int(lerp(y2, y3, t))
+            pygame.draw.line(layer, (82, 92, 112, 115), (ax, ay), (bx, by), 1)
+        self._board_lines_surfs[key] = layer
+        self._fx.blit(layer, (0, 0))
+
+    def _slice_tilesheet(self, sheet: pygame.Surface, tile_size: int = 16) -> list[pygame.Surface]:
+        # Subsurface views, not copies: downstream only ever reads the
+        # tiles (transform.scale returns a new surface), so sharing the
+        # sheet's pixels skips a per-tile allocation + memcpy.
+        tiles: list[pygame.Surface] = []
+        sw, sh = sheet.get_size()
+        for y in range(0, sh, tile_size):
+            for x in range(0, sw, tile_size):
+                rect = pygame.Rect(x, y, tile_size, tile_size)
+                tiles.append(sheet.subsurface(rect))
+        return tiles
+
+    def _blit_cached_layer(
+        self,
+        target: pygame.Surface,
+        cache_key: str,
+        key: str,
+        *,
+        scale: int,
+        alpha: int,
+        seed_shift: int,
+    ) -> None:
+        """Blit a full-screen tiled layer, compositing it on first use.
+
+        Each scene layer's parameters never change, so the per-cell
+        tiling runs once into a cached surface; afterwards the whole
+        layer costs a single blit per frame.
+        """
+        cached = self._cached_bg.get(cache_key)
+        if cached is None:
+            if not self._bg_tiles.get(key):
+                return
+            cached = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            self._draw_tiled_layer(cached, key, scale=scale, alpha=alpha, seed_shift=seed_shift)
+            self._cached_bg[cache_key] = cached
+        target.blit(cached, (0, 0))
+
+    def _draw_tiled_layer(
+        self,
+        target: pygame.Surface,
+        key: str,
+        *,
+        scale: int = 12,
+        alpha: int = 255,
+        seed_shift: int = 0,
+        offset: tuple[int, int] = (0, 0),
+    ) -> None:
+        # *offset* is the screen position of the target's top-left, so
+        # a small target can be filled with the slice of the global
+        # tile pattern that covers it (pattern stays screen-aligned).
+        tiles = self._bg_tiles.get(key)
+        if not tiles:
+            return
+        tile_px = max(8, scale)
+        scaled = self._scaled_tiles.get((key, tile_px, alpha))
+        if scaled is None:
+            # Scale/alpha are deterministic per (key, tile_px, alpha):
+            # resample each distinct tile once, then the per-cell work
+            # below is a plain blit.
+            scaled = [pygame.transform.scale(t, (tile_px, tile_px)) for t in tiles]
+            if alpha < 255:
+                for t in scaled:
+                    t.set_alpha(alpha)
+            self._scaled_tiles[(key, tile_px, alpha)] = scaled
+        cols = SCREEN_WIDTH // tile_px + 2
+        rows = SCREEN_HEIGHT // tile_px + 2
+        grid_key = (seed_shift, tile_px, len(tiles))
+        grid = self._tile_grids.get(grid_key)
+        if grid is None:
+            # deterministic tile choice (no temporal flicker), computed
+            # for the whole grid in one vectorized pass
+            gxs = np.arange(cols)
+            gys = np.arange(rows)
+            grid = (
+                (gxs[None, :] * 31 + gys[:, None] * 17 + seed_shift * 13) % len(tiles)
+            ).tolist()
+            self._tile_grids[grid_key] = grid
+        half = tile_px // 2
+        ox, oy = offset
+        tw, th = target.get_size()
+        # Only the grid cells whose tiles overlap the target region.
+        gx0 = max(0, (ox + half - tile_px) // tile_px + 1)
+        gx1 = min(cols, -(-(ox + tw + half) // tile_px))
+        gy0 = max(0, (oy + half - tile_px) // tile_px + 1)
+        gy1 = min(rows, -(-(oy + th + half) // tile_px))
+        for gy in range(gy0, gy1):
+            row = grid[gy]
+            y = gy * tile_px - half - oy
+            for gx in range(gx0, gx1):
+                target.blit(scaled[row[gx]], (gx * tile_px - half - ox, y))
+
+    def _draw_textured_polygon(
+        self,
+        target: pygame.Surface,
+        key: str,
+        polygon: list[tuple[int, int]],
+        *,
+        scale: int = 12,
+        alpha: int = 255,
+        seed_shift: int = 0,
+    ) -> None:
+        # Fill polygon with pixellab tile texture.  Work in the
+        # polygon's bounding box rather than full-screen surfaces — the
+        # bytes touched scale with the polygon area, not the window.
+        xs = [p[0] for p in polygon]
+        ys = [p[1] for p in polygon]
+        bbox = pygame.Rect(min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1)
+        bbox = bbox.clip(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+        if bbox.width <= 0 or bbox.height <= 0:
+            return
+        mask_key = tuple(polygon)
+        mask = self._poly_masks.get(mask_key)
+        if mask is None:
+            local = [(x - bbox.x, y - bbox.y) for x, y in polygon]
+            mask = pygame.Surface(bbox.size, pygame.SRCALPHA)
+            pygame.draw.polygon(mask, (255, 255, 255, 255), local)
+            self._poly_masks[mask_key] = mask
+        tex = pygame.Surface(bbox.size, pygame.SRCALPHA)
+        self._draw_tiled_layer(
+            tex, key, scale=scale, alpha=alpha, seed_shift=seed_shift, offset=bbox.topleft
+        )
+        tex.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        target.blit(tex, bbox.topleft)
+
+    def _draw_character(
+        self,
+        which: str,
+        direction: str,
+        pos: tuple[int, int],
+        *,
+        scale: float,
+        silhouette: bool = False,
+    ) -> None:
+        sprite_map = self._dorothy if which == "dorothy" else self._grandmaster
+        surf = sprite_map.get(direction)
+        if surf is None:
+            # fallback silhouette block if loading fails
+            x, y = pos
+            color = SHADOW if silhouette else (16, 18, 24)
+            pygame.draw.polygon(
+                self._world,
+                color,
+                [(x, y + 42), (x + 18, y - 38), (x + 46, y - 30), (x + 40, y + 42)],
+            )
+            return
+
+        # scale is a float; quantize the cache key so equal-looking
+        # scales always hit the same entry.
+        cache_key = (which, direction, round(scale, 3), silhouette)
+        sprite = self._sprite_cache.get(cache_key)
+        if sprite is None:
+            w = int(surf.get_width() * scale)
+            h = int(surf.get_height() * scale)
+            sprite = pygame.transform.scale(surf, (w, h))
+            if silhouette:
+                sprite.fill((12, 12, 16, 240), special_flags=pygame.BLEND_RGBA_MULT)
+            self._sprite_cache[cache_key] = sprite
+        self._world.blit(sprite, pos)
+
+    # -------------------- Data setup --------------------
+    def _set_dialogue(self, speaker: str, text: str) -> None:
+        if speaker == self._speaker and text == self._line:
+            return
+        self._speaker = speaker
+        self._line = text
+        self._typewriter.set_text(text)
+
+    def _update_dialogue_timeline(self) -> None:
+        name = self._scene.name
+        if name != self._cue_scene:
+            # update() already blanks the dialogue on scene change.
+            self._cue_scene = name
+            self._cue_idx = 0
+        cues = DIALOGUE_CUES.get(name)
+        if not cues:
+            return
+        st = self._scene.scene_time
+        idx = self._cue_idx
+        n = len(cues)
+        if idx >= n or st < cues[idx][0]:
+            return  # no cue boundary crossed — the common frame
+        while idx < n and st >= cues[idx][0]:
+            idx += 1
+        self._cue_idx = idx
+        _, speaker, text = cues[idx - 1]
+        self._set_dialogue(speaker, text)
+
+    def _init_snow(self) -> None:
+        rng = self._np_rng
+        n = 320
+        self._snow_x = rng.uniform(0, SCREEN_WIDTH, n).astype(np.float32)
+        self._snow_y = rng.uniform(-SCREEN_HEIGHT, SCREEN_HEIGHT, n).astype(np.float32)
+        self._snow_vy = rng.uniform(24, 165, n).astype(np.float32)
+        self._snow_vx = rng.uniform(-40, -8, n).astype(np.float32)
+        self._snow_alpha = rng.integers(80, 221, n, dtype=np.uint8)
+        self._snow_size = rng.choice(np.array([1, 1, 1, 2], dtype=np.uint8), n)
+
+    def _update_snow(self, dt: float) -> None:
+        if self._scene.name != "exterior":
+            return
+        self._snow_y += self._snow_vy * dt
+        self._snow_x += self._snow_vx * dt
+        wrapped = self._snow_y > SCREEN_HEIGHT
+        n_wrapped = int(wrapped.sum())
+        if n_wrapped:
+            rng = self._np_rng
+            self._snow_y[wrapped] = rng.uniform(-32, -4, n_wrapped)
+            self._snow_x[wrapped] = rng.uniform(0, SCREEN_WIDTH, n_wrapped)
+
+    def _load_pixellab_assets(self) -> None:
+        self._dorothy.clear()
+        self._grandmaster.clear()
+        self._bg_sheets.clear()
+        self._bg_tiles.clear()
+        self._scaled_tiles.clear()
+        self._cached_bg.clear()
+        self._sprite_cache.clear()
+
+        # Kick off all downloads in parallel; if the network is
+        # unavailable, scenes still run with fallback silhouettes.
+        self._asset_pool = ThreadPoolExecutor(max_workers=8)
+        for key, url in DOROTHY_URLS.items():
+            self._asset_futures[("dorothy", key)] = self._asset_pool.submit(fetch_url_bytes, url)
+        for key, url in GRANDMASTER_URLS.items():
+            self._asset_futures[("grandmaster", key)] = self._asset_pool.submit(fetch_url_bytes, url)
+        bg_sources = {
+            "exterior": EXTERIOR_TILESET_URL,
+            "stage": STAGE_TILESET_URL,
+            "void": VOID_TILESET_URL,
+        }
+        for key, url in bg_sources.items():
+            self._asset_futures[("bg", key)] = self._asset_pool.submit(fetch_url_bytes, url)
+
+    def _poll_asset_futures(self) -> None:
+        """Decode any finished downloads (main thread only)."""
+        done = [k for k, fut in self._asset_futures.items() if fut.done()]
+        for group, key in done:
+            data = self._asset_futures.pop((group, key)).result()
+            if data is None:
+                continue
+            try:
+                img = pygame.image.load(BytesIO(data)).convert_alpha()
+            except Exception:
+                continue
+            if group == "dorothy":
+                self._dorothy[key] = img
+                self._sprite_cache.clear()
+            elif group == "grandmaster":
+                self._grandmaster[key] = img
+                self._sprite_cache.clear()
+            else:
+                self._bg_sheets[key] = img
+                self._bg_tiles[key] = self._slice_tilesheet(img, tile_size=16)
+        if done:
+            self._assets_ready = bool(self._dorothy) and bool(self._grandmaster)
+        if not self._asset_futures and self._asset_pool is not None:
+            self._asset_pool.shutdown(wait=False)
+            self._asset_pool = None
+
+    def _go_to_menu(self) -> None:
+        from src.states.main_menu_state import MainMenuState
+
+        self._sm.switch(MainMenuState(self._sm))
+